@@ -1,6 +1,7 @@
 import numpy as np
 
-from tivars import TIRealList, TIMatrix
+from tivars import TIReal, TIRealList, TIMatrix
+from tivars.dtypes import entry_dtype
 
 
 # Turn a list into a NumPy array
@@ -17,3 +18,8 @@ matrix.open("../tests/data/var/Matrix_3x3_standard.8xm")
 
 arr = np.asarray(matrix.matrix(), dtype=float)
 print(arr)
+
+
+# Decode a whole list of reals in one go
+reals = np.frombuffer(lst.data, dtype=entry_dtype(TIReal), offset=2)
+print(reals["exponent"])
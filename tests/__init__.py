@@ -1,9 +1,36 @@
+import asyncio
+import copy
 import decimal
+import io
 import json
+import operator
+import os
+import pickle
+import tarfile
+import tempfile
 import unittest
+import warnings
+import zipfile
+
+from concurrent.futures import ProcessPoolExecutor
 
 from tivars.types import *
-from tivars import TIHeader, TIVar
+from tivars import TIHeader, TIVar, TIVarIndex, aiter_entries, iter_entries, scan_meta, sniff, validate
+from tivars import aio, diagnostics, DiagnosticError
+from tivars.archive import *
+from tivars.batch import *
+from tivars.catalog import *
+from tivars.columnar import *
+from tivars.delta import *
+from tivars.dtypes import *
+from tivars.shared import *
+from tivars.store import *
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
 
 
 class VarTests(unittest.TestCase):
@@ -70,6 +97,300 @@ class VarTests(unittest.TestCase):
 
         self.assertEqual(second, clibs.entries[1])
 
+    def test_load_buffers(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/clibs.8xg")
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            data = file.read()
+
+        for buffer in data, bytearray(data), memoryview(data):
+            test_buffer = TIVar()
+            test_buffer.load_bytes(buffer)
+            self.assertEqual(test_buffer, test_var)
+
+    def test_iter_entries(self):
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+
+        header = TIHeader()
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            self.assertEqual(list(iter_entries(file, header=header)), clibs.entries)
+
+        self.assertEqual(header, clibs.header)
+
+        data = bytearray(clibs.bytes())
+        data[-1] ^= 0xFF
+        with diagnostics() as diag:
+            self.assertEqual(len(list(iter_entries(io.BytesIO(data)))), 9)
+            self.assertEqual(len(list(iter_entries(io.BytesIO(data[:-100])))), 8)
+
+        self.assertEqual(diag.counts["checksum"], 1)
+        self.assertEqual(diag.counts["entry_truncated"], 1)
+
+    def test_scan_meta(self):
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            data = file.read()
+            file.seek(0)
+
+            for meta in scan_meta("tests/data/var/clibs.8xg"), scan_meta(file), scan_meta(data):
+                self.assertEqual([entry.raw.name for entry in clibs.entries], [entry.name for entry in meta])
+                self.assertEqual([entry.data_length for entry in clibs.entries],
+                                 [entry.data_length for entry in meta])
+
+        program, = scan_meta("tests/data/var/Program.8xp")
+        self.assertEqual(program.entry_type, TIProgram)
+        self.assertEqual(program.decode_name(), "SETDATE")
+        self.assertEqual(program.version, b'\x04')
+        self.assertFalse(program.archived)
+
+    def test_open_lazy(self):
+        clibs, lazy = TIVar(), TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+        lazy.open_lazy("tests/data/var/clibs.8xg")
+
+        self.assertEqual(lazy.header, clibs.header)
+        self.assertEqual(lazy.entries, clibs.entries)
+        self.assertEqual(lazy.bytes(), clibs.bytes())
+
+        test_var = TIVar()
+        test_var.open_lazy("tests/data/var/Program.8xp")
+        self.assertIsInstance(test_var.entries[0].raw.peek("data"), memoryview)
+
+        test_var.entries[0].length = 0
+        self.assertIsInstance(test_var.entries[0].raw.peek("data"), bytearray)
+        self.assertEqual(test_var.entries[0].length, 0)
+
+        # Lazy entries' data can be edited in place, like any other entry's
+        test_var = TIVar()
+        test_var.open_lazy("tests/data/var/Program.8xp")
+
+        with test_var.entries[0].edit() as data:
+            data[2] = 0x41
+
+        self.assertEqual(test_var.entries[0].data[:3] + b'x', b'\x03\x00\x41x')
+        self.assertEqual(test_var.bytes()[74], 0x41)
+
+        # Lazy vars can be saved over the file they map, and release it when closed
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clibs.8xg")
+            with open(path, 'wb') as file:
+                file.write(clibs.bytes())
+
+            with TIVar() as test_var:
+                test_var.open_lazy(path)
+                mapping = test_var._mapping
+                test_var.save(path)
+
+            self.assertTrue(mapping.closed)
+            self.assertEqual(os.path.getsize(path), len(clibs.bytes()))
+
+            test_var = TIVar()
+            test_var.open_lazy(path)
+            asyncio.run(test_var.asave(path))
+            test_var.close()
+
+            test_var = TIVar()
+            test_var.open(path)
+            self.assertEqual(test_var, clibs)
+
+            with open(path := os.path.join(directory, "empty.8xg"), 'wb'):
+                pass
+
+            with diagnostics(mode="silent"), TIVar() as test_var:
+                test_var.open_lazy(path)
+                self.assertEqual(test_var.entries, [])
+
+    def test_copy(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/Program.8xp")
+
+        length = test_var.entries[0].length
+        clone = copy.copy(test_var)
+        self.assertEqual(clone, test_var)
+        self.assertIs(clone.entries[0].raw.peek("data"), test_var.entries[0].raw.peek("data"))
+
+        # Reading from a copy doesn't copy its data
+        clone.entries[0].string()
+        self.assertEqual(clone.entries[0].data, test_var.entries[0].data)
+        self.assertIs(clone.entries[0].raw.peek("data"), test_var.entries[0].raw.peek("data"))
+
+        clone.entries[0].length = 0
+        clone.header.comment = "A different comment"
+        self.assertNotEqual(clone.bytes(), test_var.bytes())
+        self.assertEqual(test_var.entries[0].length, length)
+        self.assertEqual(clone.checksum, int.to_bytes(sum(clone.bytes()[55:-2]) & 0xFFFF, 2, 'little'))
+
+        test_var.entries[0].name = "OTHER"
+        self.assertEqual(copy.copy(test_var.entries[0]).name, "OTHER")
+        self.assertNotEqual(clone.entries[0].name, "OTHER")
+
+        # Writing to the original after copying it leaves the copy alone
+        original = test_var.entries[0]
+        data = bytes(original.data)
+        clone = copy.copy(original)
+
+        with original.edit() as buffer:
+            buffer[2] = 0x41
+
+        self.assertIsInstance(original.data, bytes)
+        self.assertEqual(original.data + b'x', data[:2] + b'\x41' + data[3:] + b'x')
+        self.assertEqual(clone.data, data)
+
+    def test_digest(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/clibs.8xg")
+
+        clone = TIVar()
+        clone.open("tests/data/var/clibs.8xg")
+        self.assertEqual(hash(clone), hash(test_var))
+        self.assertEqual(len({*test_var.entries, *clone.entries}), len(test_var.entries))
+
+        digest = clone.entries[0].digest
+        clone.entries[0].name = "OTHER"
+        self.assertNotEqual(clone.entries[0].digest, digest)
+        self.assertNotEqual(clone, test_var)
+
+        test_var.entries[0].name = "OTHER"
+        self.assertEqual(clone.entries[0].digest, test_var.entries[0].digest)
+
+        # Reading the data section keeps the digest cached
+        digest = clone.entries[0].digest
+        self.assertEqual(clone.entries[0].data, test_var.entries[0].data)
+        self.assertIs(clone.entries[0].raw._digest, digest)
+        self.assertIs(clone.entries[0].digest, digest)
+
+        with clone.entries[0].edit() as data:
+            data[3] ^= 1
+
+        self.assertNotEqual(clone.entries[0].digest, digest)
+        self.assertNotEqual(clone.entries[0], test_var.entries[0])
+
+        with clone.entries[0].edit() as data:
+            data[3] ^= 1
+
+        self.assertEqual(clone.entries[0].digest, digest)
+
+        clone.entries[0].data = b'\x00\x00'
+        self.assertNotEqual(clone.entries[0], test_var.entries[0])
+        self.assertNotIn(clone.entries[0], set(test_var.entries))
+
+    def test_pickle(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/Image1.8ca")
+
+        clone = pickle.loads(pickle.dumps(test_var))
+        self.assertEqual(clone.bytes(), test_var.bytes())
+        self.assertEqual(clone.extension, "8ca")
+        self.assertIsInstance(clone.entries[0], TIImage)
+
+        # Out-of-band buffers are viewed, not copied
+        buffers = []
+        data = pickle.dumps(test_var.entries[0], protocol=5, buffer_callback=buffers.append)
+        self.assertLess(len(data), 256)
+
+        entry = pickle.loads(data, buffers=buffers)
+        self.assertEqual(entry, test_var.entries[0])
+        self.assertIs(entry.raw.peek("data").obj, test_var.entries[0].raw.peek("data"))
+
+        entry.data = b'\x00\x00'
+        self.assertNotEqual(test_var.entries[0].data, b'\x00\x00')
+        self.assertEqual(pickle.loads(pickle.dumps(TIEntry(), protocol=2)), TIEntry())
+
+        # Writing to the original afterwards leaves the clone alone
+        test_var = TIVar()
+        test_var.open("tests/data/var/Program.8xp")
+        original = test_var.entries[0]
+        data = original.bytes()
+
+        buffers = []
+        clone = pickle.loads(pickle.dumps(original, protocol=5, buffer_callback=buffers.append), buffers=buffers)
+
+        original.length = 0
+        self.assertEqual(clone.bytes(), data)
+        self.assertNotEqual(clone, original)
+
+        original.load_string("Disp 12345")
+        self.assertEqual(clone.bytes(), data)
+
+        # Extra raw fields survive too
+        test_var = TIVar()
+        test_var.open("tests/data/var/GraphDataBase.8xd")
+        equation = test_var.entries[0].equations[0]
+
+        for protocol in 2, 5:
+            clone = pickle.loads(pickle.dumps(equation, protocol=protocol))
+            self.assertEqual(clone.bytes(), equation.bytes())
+            self.assertEqual(clone.style, equation.style)
+
+    def test_checksum(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/Matrix_3x3_standard.8xm")
+
+        def full_checksum():
+            return int.to_bytes(sum(test_var.bytes()[55:-2]) & 0xFFFF, 2, 'little')
+
+        self.assertEqual(test_var.checksum, full_checksum())
+
+        test_var.entries[0].name = "[B]"
+        test_var.entries[0].width = 1
+        self.assertEqual(test_var.checksum, full_checksum())
+
+        test_var.entries[0].data = bytearray(b'\x01\x01') + TIReal(5).data
+        self.assertEqual(test_var.checksum, full_checksum())
+
+        test_var.open("tests/data/var/Matrix_3x3_standard.8xm")
+        with test_var.entries[0].edit() as data:
+            data[2] ^= 1
+            self.assertEqual(test_var.checksum, full_checksum())
+
+            data[3] ^= 1
+            self.assertEqual(test_var.checksum, full_checksum())
+
+        self.assertEqual(test_var.checksum, full_checksum())
+
+        # Reading the data section doesn't cost the entry its running sum
+        self.assertEqual(test_var.entries[0].data, test_var.entries[0].raw.peek("data"))
+        self.assertIsNotNone(test_var.entries[0].raw._data_sum)
+
+    def test_index(self):
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+
+        index = TIVarIndex()
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            index.load_var_file(file)
+
+            self.assertEqual(len(index), 9)
+            self.assertEqual(index[1].type_id, b'\x15')
+
+            persisted = TIVarIndex()
+            persisted.load_bytes(index.bytes())
+            self.assertEqual(persisted, index)
+
+            for i in reversed(range(len(index))):
+                entry = TIEntry()
+                entry.load_from_file(file, offset=i, index=persisted)
+                self.assertEqual(entry, clibs.entries[i])
+
+        lazy = TIVar()
+        lazy.open_lazy("tests/data/var/clibs.8xg")
+        self.assertEqual(lazy.index, index)
+        self.assertEqual(lazy.entry_at(4), clibs.entries[4])
+
+        # The index follows the entries as they change
+        lazy.entry_at(0).clear()
+        self.assertEqual(lazy.index[0].data_length, lazy.entry_at(0).data_length)
+        self.assertEqual(lazy.index[1].offset, 55 + len(lazy.entry_at(0)))
+        self.assertEqual(lazy.index[1].type_id, index[1].type_id)
+
+        clibs.add_entry(copy.copy(clibs.entries[1]))
+        self.assertEqual(len(clibs.index), 10)
+        self.assertEqual(clibs.index[9].offset, len(clibs) - len(clibs.entries[1]))
+
     def test_save_to_file(self):
         test_var = TIVar()
         test_var.open("tests/data/var/Program.8xp")
@@ -81,6 +402,52 @@ class VarTests(unittest.TestCase):
             with open("tests/data/var/Program_new.8xp", 'rb') as new:
                 self.assertEqual(new.read(), orig.read())
 
+    def test_validate(self):
+        with open("tests/data/var/Program.8xp", 'rb') as file:
+            data = bytearray(file.read())
+
+        report = validate(data)
+        self.assertTrue(report.valid)
+        self.assertEqual(report.entry_count, 1)
+
+        self.assertEqual(validate(data[:-10]).codes, {"entry_length", "entry_truncated", "checksum"})
+
+        data[-1] ^= 0xFF
+        data[57] = 0x06
+        self.assertEqual(validate(data).codes, {"data_length", "checksum"})
+        self.assertEqual(validate(b'**TI83F*').codes, {"truncated"})
+
+        data[57] = 0x05
+        data[59] = 0x40
+        self.assertEqual(validate(data).codes, {"type_id", "checksum"})
+
+        for path in os.listdir("tests/data/var"):
+            if path != "LICENSE":
+                with open(f"tests/data/var/{path}", 'rb') as file:
+                    self.assertTrue(validate(file.read()).valid, path)
+
+    def test_sniff(self):
+        for path in ["Program.8xp", "RealList.8xl", "Matrix_3x3_standard.8xm", "Image1.8ca", "GraphDataBase.8xd"]:
+            test_var = TIVar()
+            test_var.open(f"tests/data/var/{path}")
+
+            self.assertEqual(sniff(f"tests/data/var/{path}").entry_type, type(test_var.entries[0]))
+            self.assertEqual(sniff(test_var.bytes()).model, test_var.header.derive_model())
+
+        self.assertEqual(sniff("tests/data/var/Matrix_3x3_standard.8xm").dimensions, {"width": 3, "height": 3})
+        self.assertEqual(sniff(test_var.entries[0].mono().export().bytes()).entry_type, TIMonoFuncGDB)
+
+    def test_write_var_file(self):
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+
+        with io.BytesIO() as file:
+            clibs.write_var_file(file)
+            self.assertEqual(file.getvalue(), clibs.bytes())
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            self.assertEqual(clibs.bytes(), file.read())
+
     def test_truthiness(self):
         test_var = TIVar()
         self.assertEqual(bool(test_var), False)
@@ -92,6 +459,315 @@ class VarTests(unittest.TestCase):
         self.assertEqual(bool(test_var), False)
 
 
+class EntryBatchTests(unittest.TestCase):
+    def test_entry_batch(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/clibs.8xg")
+
+        batch = EntryBatch(test_var.entries)
+        self.assertEqual(len(batch), len(test_var.entries))
+        self.assertEqual(list(batch), test_var.entries)
+        self.assertEqual(batch.name(0), test_var.entries[0].raw.name)
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            other = EntryBatch()
+            other.add_var_bytes(file.read())
+
+        self.assertEqual(other.data, batch.data)
+        self.assertEqual(other.meta(3), test_var.entries[3].raw.meta)
+
+        indices = batch.where(test_var.entries[0].raw.type_id)
+        self.assertEqual(indices, [index for index, entry in enumerate(test_var.entries)
+                                   if entry.raw.type_id == test_var.entries[0].raw.type_id])
+
+        filtered = batch.filter(test_var.entries[0].raw.type_id)
+        self.assertEqual(list(filtered), [test_var.entries[index] for index in indices])
+        self.assertEqual(len(batch.filter(b'\x05', b'\x06')), 0)
+
+        batch.append(program := TIProgram("Disp 1"))
+        self.assertEqual(batch[-1], program)
+        self.assertIsInstance(batch[-1], TIProgram)
+
+
+class DeltaTests(unittest.TestCase):
+    def test_program(self):
+        old = TIVar()
+        old.open("tests/data/var/ALLTOKS.8Xp")
+
+        new = copy.copy(old)
+        data = bytearray(new.entries[0].data)
+        new.entries[0].data = data[:100] + b'\xDE\x2A\x48' + data[103:]
+
+        delta = diff(old, new)
+        self.assertLess(len(delta), 48)
+
+        patched = apply(old, delta)
+        self.assertEqual(patched.bytes(), new.bytes())
+        self.assertEqual(patched.checksum, new.checksum)
+        self.assertIsInstance(patched.entries[0], TIProgram)
+
+        self.assertEqual(apply(old, diff(old, old)).bytes(), old.bytes())
+
+    def test_group(self):
+        old = TIVar()
+        old.open("tests/data/var/clibs.8xg")
+
+        new = TIVar(header=TIHeader(comment="A different comment"))
+        for entry in [old.entries[3], *old.entries[5:], old.entries[0]]:
+            new.add_entry(entry)
+
+        program = TIProgram("Disp 1")
+        new.add_entry(program)
+
+        delta = diff(old, new)
+        self.assertLess(len(delta), 200)
+        self.assertEqual(apply(old, delta).bytes(), new.bytes())
+
+        with self.assertRaises(ValueError):
+            apply(old, new.bytes())
+
+
+class DiagnosticsTests(unittest.TestCase):
+    def setUp(self):
+        with open("tests/data/var/Program.8xp", 'rb') as file:
+            self.data = bytearray(file.read())
+
+        self.data[-1] ^= 0xFF
+
+    def test_collect(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            with diagnostics() as diag:
+                test_var = TIVar()
+                test_var.load_bytes(self.data)
+
+        self.assertEqual(diag.counts["checksum"], 1)
+        self.assertEqual(diag.issues[0].code, "checksum")
+        self.assertEqual(diag.issues[0].offset, len(self.data) - 2)
+        self.assertTrue(str(diag.issues[0]).startswith("The checksum is incorrect"))
+
+        with self.assertWarns(BytesWarning):
+            test_var.load_bytes(self.data)
+
+    def test_entry(self):
+        with diagnostics() as diag:
+            entry = TIReal()
+            entry.load_bytes(self.data[55:-2])
+
+        self.assertEqual(diag.issues[0].code, "type_id")
+        self.assertEqual(diag.issues[0].entry[0], "TIReal")
+        self.assertEqual(diag.issues[0].offset, 4)
+
+    def test_strict(self):
+        with diagnostics(mode="strict"), self.assertRaises(DiagnosticError) as context:
+            TIVar().load_bytes(self.data)
+
+        self.assertEqual(context.exception.issue.code, "checksum")
+
+    def test_silent(self):
+        with diagnostics(mode="silent") as diag:
+            for _ in range(3):
+                TIVar().load_bytes(self.data)
+
+        self.assertEqual(diag.issues, [])
+        self.assertEqual(len(diag), 3)
+
+
+class BatchTests(unittest.TestCase):
+    paths = ["tests/data/var/Program.8xp", "tests/data/var/clibs.8xg", "tests/data/var/missing.8xp"]
+
+    def test_load_many(self):
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            results = list(load_many(self.paths, workers=2))
+            self.assertEqual(results[1].result, clibs)
+
+        self.assertEqual(caught, [])
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertIn("BytesWarning", [category for category, message in results[1].warnings])
+
+        self.assertIsNone(results[2].result)
+        self.assertTrue(results[2].error.startswith("FileNotFoundError"))
+
+    def test_map_entries(self):
+        results = list(map_entries(self.paths[:2], len, workers=2))
+
+        self.assertEqual(results[0].result, [22])
+        self.assertEqual(len(results[1].result), 9)
+
+
+class ArchiveTests(unittest.TestCase):
+    names = ["Program.8xp", "RealList.8xl", "clibs.8xg"]
+
+    def check_archive(self, path: str):
+        for parallel in False, True:
+            results = list(open_archive(path, parallel=parallel, workers=2))
+            self.assertEqual([result.path for result in results], self.names)
+
+            for name, result in zip(self.names, results):
+                test_var = TIVar()
+                test_var.open(f"tests/data/var/{name}")
+                self.assertEqual(result.result, test_var)
+
+    def test_zip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with zipfile.ZipFile(path := os.path.join(directory, "bundle.tig"), 'w', zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("README.txt", "Not a var")
+                for name in self.names:
+                    archive.write(f"tests/data/var/{name}", name)
+
+            self.check_archive(path)
+
+    def test_tar(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with tarfile.open(path := os.path.join(directory, "bundle.tar.gz"), 'w:gz') as archive:
+                for name in self.names:
+                    archive.add(f"tests/data/var/{name}", name)
+
+            self.check_archive(path)
+
+    def test_write_bundle(self):
+        test_vars = []
+        for name in self.names:
+            test_var = TIVar(name=name.split(".")[0])
+            test_var.open(f"tests/data/var/{name}")
+            test_vars.append(test_var)
+
+        with tempfile.TemporaryDirectory() as directory:
+            names = write_bundle(path := os.path.join(directory, "bundle.tig"), iter(test_vars), workers=2)
+            self.assertEqual(names, self.names)
+
+            with zipfile.ZipFile(path) as archive:
+                self.assertEqual(archive.namelist(), self.names)
+                self.assertEqual(archive.read("Program.8xp"), test_vars[0].bytes())
+
+            self.check_archive(path)
+
+            unnamed = TIVar()
+            unnamed.load_bytes(test_vars[0].bytes())
+            self.assertEqual(write_bundle(path, [unnamed]), ["SETDATE.8xp"])
+
+            with self.assertRaises(ValueError):
+                write_bundle(path, [unnamed, copy.copy(unnamed)])
+
+
+class SharedCorpusTests(unittest.TestCase):
+    paths = ["tests/data/var/Program.8xp", "tests/data/var/RealList.8xl", "tests/data/var/clibs.8xg"]
+
+    def test_shared_corpus(self):
+        files = []
+        for path in self.paths:
+            with open(path, 'rb') as file:
+                files.append(file.read())
+
+        with SharedCorpus.load(self.paths) as corpus:
+            self.assertEqual(list(corpus), self.paths)
+
+            test_var = corpus["tests/data/var/Program.8xp"]
+            self.assertEqual(test_var.bytes(), files[0])
+            self.assertIs(test_var.entries[0].raw.peek("data").obj, corpus.view(0).obj)
+
+            test_var.entries[0].length = 0
+            self.assertEqual(corpus.var(0).bytes(), files[0])
+            del test_var
+
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(operator.getitem, [corpus] * len(files), range(len(files))))
+
+            self.assertEqual([result.bytes() for result in results], files)
+
+
+class CatalogTests(unittest.TestCase):
+    def test_scan(self):
+        with Catalog() as catalog:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertGreater(catalog.scan("tests/data/var"), 0)
+
+            self.assertEqual(caught, [])
+            self.assertEqual(catalog.scan("tests/data/var"), 0)
+            self.assertEqual(catalog.connection.execute("SELECT path FROM skipped").fetchall(),
+                             [("tests/data/var/LICENSE",)])
+
+            self.assertEqual(len(catalog.find(type_id=b'\x15', name=b'LibLoad')), 1)
+
+            programs = catalog.find(containing=b'\xEF\x00')
+            self.assertIn("tests/data/var/Program.8xp", [entry.path for entry in programs])
+
+            entry = catalog.find(type_id=b'\x15', name=b'GRAPHX')[0]
+            with open(entry.path, 'rb') as file:
+                test_entry = TIEntry()
+                test_entry.load_from_file(file, offset=entry.index)
+
+            self.assertEqual(test_entry.raw.name, b'GRAPHX\x00\x00')
+
+
+class StoreTests(unittest.TestCase):
+    def test_deduplication(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with VarStore(directory) as store:
+                key = store.add_file("tests/data/var/Program.8xp")
+
+                test_var = TIVar()
+                test_var.open("tests/data/var/Program.8xp")
+                test_var.header.comment = "A different comment"
+                test_var.entries[0].name = "OTHER"
+
+                other = store.add(test_var)
+                self.assertNotEqual(key, other)
+                self.assertEqual(store.add_file("tests/data/var/Program.8xp"), key)
+                self.assertEqual(len(store), 2)
+                self.assertEqual(os.path.getsize(store.pack_path(0)), test_var.entries[0].data_length)
+
+                with open("tests/data/var/Program.8xp", 'rb') as file:
+                    self.assertEqual(store.bytes(key), file.read())
+
+                self.assertEqual(store.get(other), test_var)
+
+
+class AsyncTests(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        aio.configure()
+
+    async def test_aopen(self):
+        aio.configure(limit=2)
+
+        test_vars = [TIVar() for _ in range(4)]
+        await asyncio.gather(*(test_var.aopen("tests/data/var/clibs.8xg") for test_var in test_vars))
+
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+        self.assertTrue(all(test_var == clibs for test_var in test_vars))
+
+        test_program = TIEntry()
+        await test_program.aopen("tests/data/var/Program.8xp")
+        self.assertEqual(type(test_program), TIProgram)
+
+    async def test_asave(self):
+        test_var = TIVar()
+        test_var.open("tests/data/var/Program.8xp")
+
+        with tempfile.TemporaryDirectory() as directory:
+            await test_var.asave(os.path.join(directory, "Program.8xp"))
+
+            with open(os.path.join(directory, "Program.8xp"), 'rb') as file:
+                self.assertEqual(file.read(), test_var.bytes())
+
+    async def test_aiter_entries(self):
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            stream = asyncio.StreamReader()
+            stream.feed_data(file.read())
+            stream.feed_eof()
+
+        clibs = TIVar()
+        clibs.open("tests/data/var/clibs.8xg")
+        self.assertEqual([entry async for entry in aiter_entries(stream)], clibs.entries)
+
+
 class EntryTests(unittest.TestCase):
     def test_save_to_file(self):
         test_program = TIEntry()
@@ -121,6 +797,18 @@ class EntryTests(unittest.TestCase):
             test_var.load_var_file(file)
             self.assertEqual(test_header | [test_program], test_var)
 
+    def test_from_raw(self):
+        test_program = TIEntry()
+        test_program.open("tests/data/var/Program.8xp")
+
+        test_entry = TIEntry.from_raw(test_program.raw.meta, test_program.raw.data)
+        self.assertEqual(type(test_entry), TIProgram)
+        self.assertEqual(test_entry, test_program)
+
+        test_list = TIVar()
+        test_list.open("tests/data/var/RealList.8xl")
+        self.assertEqual([float(entry) for entry in test_list.entries[0].list()], [-1.0, 2.0, 999.0])
+
     def test_truthiness(self):
         test_program = TIEntry()
         self.assertEqual(bool(test_program), False)
@@ -244,6 +932,27 @@ class NumericTests(unittest.TestCase):
         self.assertEqual(str(test_real_list), "[-1, 2, 999]")
         self.assertEqual(f"{test_real_list:t}", "{~1,2,999}")
 
+    def test_list_views(self):
+        test_real_list = TIRealList()
+        test_real_list.open("tests/data/var/RealList.8xl")
+
+        views = list(test_real_list.views())
+        self.assertEqual([view.float() for view in views], [-1.0, 2.0, 999.0])
+        self.assertEqual([view.data for view in views], [bytes(entry.data) for entry in test_real_list.list()])
+
+        views[1].load_string("-3.5")
+        self.assertEqual(test_real_list.list()[1], TIReal("-3.5"))
+        self.assertEqual(str(test_real_list), "[-1, -3.5, 999]")
+
+        test_comp_list = TIComplexList()
+        test_comp_list.open("tests/data/var/ComplexList.8xl")
+
+        view = next(test_comp_list.views())
+        self.assertEqual(complex(view), 1 + 1j)
+
+        view.load_complex(2 - 1j)
+        self.assertEqual(test_comp_list.list()[0], TIComplex(2 - 1j))
+
     def test_complex_list(self):
         test_comp_list = TIComplexList()
         test_comp_list.open("tests/data/var/ComplexList.8xl")
@@ -358,6 +1067,35 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(test_table.DeltaTbl, TIReal("1"))
 
 
+@unittest.skipIf(np is None, "NumPy is not installed")
+class DtypeTests(unittest.TestCase):
+    def test_reals(self):
+        test_list = TIRealList()
+        test_list.open("tests/data/var/RealList.8xl")
+
+        reals = np.frombuffer(test_list.data, dtype=entry_dtype(TIReal), offset=2)
+        self.assertEqual(len(reals), test_list.length)
+        self.assertEqual(list(reals["exponent"]), [real.exponent for real in test_list.list()])
+        self.assertIs(entry_dtype(TIReal), entry_dtype(TIReal))
+
+    def test_window(self):
+        test_window = TIWindowSettings()
+        test_window.open("tests/data/var/Window.8xw")
+
+        window = np.frombuffer(test_window.data, dtype=entry_dtype(TIWindowSettings))[0]
+        self.assertEqual(entry_dtype(TIWindowSettings).itemsize, TIWindowSettings.min_data_length)
+        self.assertEqual(window["Xmax"]["exponent"], test_window.Xmax.exponent)
+        self.assertEqual(bytes(window["Ymin"]["mantissa"]), test_window.Ymin.data[2:])
+
+    def test_gdb(self):
+        test_gdb = TIMonoGDB()
+        test_gdb.open("tests/data/var/GraphDataBase.8xd")
+
+        header = np.frombuffer(test_gdb.data, dtype=entry_dtype(TIMonoGDB), count=1)[0]
+        self.assertEqual(header["mode_id"], test_gdb.mode_id)
+        self.assertEqual(header["Xmin"]["exponent"], test_gdb.Xmin.exponent)
+
+
 class GDBTests(unittest.TestCase):
     def test_func_gdb(self):
         test_gdb = TIMonoGDB()
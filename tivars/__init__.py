@@ -3,4 +3,7 @@ from .tokenizer import *
 from .types import *
 
 from .flags import *
+from .issues import *
 from .var import *
+from .validation import *
+from .sniffing import *
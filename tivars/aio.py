@@ -0,0 +1,58 @@
+import asyncio
+import contextlib
+import contextvars
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncContextManager, ByteString, Callable
+from weakref import WeakKeyDictionary
+
+
+executor: Executor | None = None
+limit: int | None = None
+
+_semaphores = WeakKeyDictionary()
+
+
+def configure(*, executor: Executor | None = None, limit: int | None = None):
+    # Parsing and serializing mutate the var in place, so the executor should run threads
+    globals().update(executor=executor, limit=limit)
+    _semaphores.clear()
+
+
+def limited() -> AsyncContextManager:
+    if limit is None:
+        return contextlib.AsyncExitStack()
+
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(limit)
+
+    return _semaphores[loop]
+
+
+async def run(func: Callable, *args, **kwargs):
+    # Run in a copy of the caller's context so any active diagnostics still collect
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
+def _read(filename: str) -> bytes:
+    with open(filename, 'rb') as file:
+        return file.read()
+
+
+def _write(filename: str, parts: list[ByteString]):
+    with open(filename, 'wb+') as file:
+        file.writelines(parts)
+
+
+async def read_file(filename: str) -> bytes:
+    return await asyncio.get_running_loop().run_in_executor(None, _read, filename)
+
+
+async def write_file(filename: str, parts: list[ByteString]):
+    await asyncio.get_running_loop().run_in_executor(None, _write, filename, parts)
+
+
+__all__ = ["configure", "limited", "run", "read_file", "write_file"]
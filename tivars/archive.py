@@ -0,0 +1,81 @@
+import os
+import tarfile
+import zipfile
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+from .batch import BatchResult, load_result
+from .validation import MAGICS
+from .var import TIVar
+
+
+def _members(path: str) -> Iterator[tuple[str, bytes]]:
+    # Members are decompressed into memory one at a time; nothing is extracted to disk
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename, archive.read(info)
+
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as archive:
+            for info in archive:
+                if info.isfile():
+                    yield info.name, archive.extractfile(info).read()
+
+    else:
+        raise ValueError(f"{path} is not a zip or tar archive")
+
+
+def _in_order(executor: Executor, func: Callable, items: Iterable[tuple], workers: int = None) -> Iterator:
+    # Items are processed ahead in the pool, but yielded in order with only a few per worker held at once
+    window, pending = 4 * (workers or os.cpu_count() or 1), deque()
+    for item in items:
+        pending.append(executor.submit(func, *item))
+
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def open_archive(path: str, *, parallel: bool = False, workers: int = None) -> Iterator[BatchResult]:
+    # Members which aren't var files (e.g. readmes) are skipped
+    var_members = ((name, data) for name, data in _members(path) if data[:8] in MAGICS)
+
+    if not parallel:
+        for name, data in var_members:
+            yield load_result(name, data)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _in_order(executor, load_result, var_members, workers)
+
+
+def _serialize(var: TIVar) -> tuple[str, bytes]:
+    # Vars loaded from bytes are left unnamed, so they are named after their first entry instead
+    name = var.entries[0].name if var.name == "UNNAMED" and var.entries else var.name
+    return f"{name}.{var.extension}", var.bytes()
+
+
+def write_bundle(file: str | BinaryIO, variables: Iterable[TIVar], *,
+                 workers: int = None, compression: int = zipfile.ZIP_DEFLATED) -> list[str]:
+    names, seen = [], set()
+
+    with zipfile.ZipFile(file, 'w', compression) as bundle, ThreadPoolExecutor(max_workers=workers) as executor:
+        for name, data in _in_order(executor, _serialize, ((var,) for var in variables), workers):
+            if name in seen:
+                raise ValueError(f"duplicate bundle member name {name}")
+
+            seen.add(name)
+            bundle.writestr(name, data)
+            names.append(name)
+
+    return names
+
+
+__all__ = ["open_archive", "write_bundle"]
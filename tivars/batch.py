@@ -0,0 +1,51 @@
+import warnings
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import ByteString, Callable, Iterable, Iterator
+
+from .var import TIEntry, TIVar
+
+
+BatchResult = namedtuple("BatchResult", ["path", "result", "warnings", "error"])
+
+
+def load_result(path: str, data: ByteString = None, func: Callable[[TIEntry], object] = None) -> BatchResult:
+    # Loads the var at the path, or from its data if given (e.g. an archive member), as a worker would
+    result, error = None, None
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+
+        try:
+            var = TIVar()
+            if data is not None:
+                var.load_bytes(data)
+
+            else:
+                var.open(path)
+
+            # Vars pickle as their header and each entry's class, meta, and data
+            # The parent rebuilds them without coercing (or warning about) their entries again
+            result = [func(entry) for entry in var.entries] if func is not None else var
+
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+    return BatchResult(path, result, [(w.category.__name__, str(w.message)) for w in caught], error)
+
+
+def load_many(paths: Iterable[str], *, workers: int = None, chunksize: int = 16) -> Iterator[BatchResult]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(load_result, paths, chunksize=chunksize)
+
+
+def map_entries(paths: Iterable[str], func: Callable[[TIEntry], object], *,
+                workers: int = None, chunksize: int = 16) -> Iterator[BatchResult]:
+    paths = list(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(load_result, paths, [None] * len(paths), [func] * len(paths), chunksize=chunksize)
+
+
+__all__ = ["BatchResult", "load_many", "load_result", "map_entries"]
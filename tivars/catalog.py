@@ -0,0 +1,162 @@
+import os
+import sqlite3
+
+from collections import namedtuple
+
+from tivars.models import *
+from .issues import diagnostics
+from .var import TIVar
+
+
+CatalogEntry = namedtuple("CatalogEntry", ["path", "index", "offset", "type_id", "name", "version", "archived",
+                                           "meta_length", "data_length", "model"])
+
+
+class Catalog:
+    magics = b'**TI82**', b'**TI83**', b'**TI83F*'
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            mtime INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            magic BLOB NOT NULL,
+            extra BLOB NOT NULL,
+            product_id BLOB NOT NULL,
+            comment BLOB NOT NULL,
+            model TEXT,
+            checksum INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS entries (
+            path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+            idx INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            type_id BLOB NOT NULL,
+            name BLOB NOT NULL,
+            version BLOB NOT NULL,
+            archived BLOB NOT NULL,
+            meta_length INTEGER NOT NULL,
+            data_length INTEGER NOT NULL,
+            data BLOB,
+            PRIMARY KEY (path, idx)
+        );
+
+        CREATE TABLE IF NOT EXISTS skipped (
+            path TEXT PRIMARY KEY,
+            mtime INTEGER NOT NULL,
+            size INTEGER NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS entries_type_id ON entries(type_id);
+        CREATE INDEX IF NOT EXISTS entries_name ON entries(name);
+    """
+
+    def __init__(self, database: str = ":memory:", *, store_data: bool = True):
+        self.store_data = store_data
+
+        self.connection = sqlite3.connect(database)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(self.schema)
+
+    def __enter__(self) -> 'Catalog':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def scan(self, directory: str) -> int:
+        # Files whose modification time and size are unchanged since the last scan are skipped
+        # Files which aren't vars are remembered too, so they aren't read again either
+        known = {path: (mtime, size) for path, mtime, size in
+                 self.connection.execute("SELECT path, mtime, size FROM files UNION ALL "
+                                         "SELECT path, mtime, size FROM skipped")}
+        seen, count = set(), 0
+
+        with self.connection:
+            for root, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    stat = os.stat(path)
+                    seen.add(path)
+
+                    if known.get(path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+
+                    self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                    self.connection.execute("DELETE FROM skipped WHERE path = ?", (path,))
+                    count += self._index(path, stat)
+
+            # Forget files which have been removed
+            prefix = os.path.join(directory, "")
+            removed = [(path,) for path in known if path.startswith(prefix) and path not in seen]
+            self.connection.executemany("DELETE FROM files WHERE path = ?", removed)
+            self.connection.executemany("DELETE FROM skipped WHERE path = ?", removed)
+
+        return count
+
+    def _index(self, path: str, stat: os.stat_result) -> int:
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        if data[:8] not in self.magics:
+            self.connection.execute("INSERT INTO skipped VALUES (?, ?, ?)", (path, stat.st_mtime_ns, stat.st_size))
+            return 0
+
+        # Entries are only built once they're asked for, so they must be read inside the block too
+        with diagnostics("silent"):
+            var = TIVar()
+            var.load_view(memoryview(data))
+            model = var.header.derive_model()
+            entries = var.entries
+            checksum = int.from_bytes(data[55 + var.entry_length:][:2], 'little')
+
+        header = var.header.raw
+        self.connection.execute("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (path, stat.st_mtime_ns, stat.st_size,
+                                 header.magic, header.extra, header.product_id, header.comment,
+                                 model.name if model is not None else None,
+                                 checksum))
+
+        for index, (record, entry) in enumerate(zip(var.index, entries)):
+            self.connection.execute("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (path, index, record.offset, entry.raw.type_id, entry.raw.name,
+                                     entry.raw.version, entry.raw.archived, entry.meta_length, entry.data_length,
+                                     bytes(entry.raw.peek("data")) if self.store_data else None))
+
+        return 1
+
+    def query(self, where: str = "1", parameters: tuple = ()) -> list[CatalogEntry]:
+        return [CatalogEntry(*row) for row in self.connection.execute(
+            "SELECT entries.path, idx, offset, type_id, name, version, archived, meta_length, data_length, model "
+            "FROM entries JOIN files USING (path) "
+            f"WHERE {where} ORDER BY entries.path, idx", parameters)]
+
+    def find(self, *, type_id: bytes = None, name: bytes = None, model: TIModel = None,
+             min_length: int = None, max_length: int = None, containing: bytes = None) -> list[CatalogEntry]:
+        clauses, parameters = ["1"], []
+
+        for clause, value in (("type_id = ?", type_id), ("name = ?", name and name.ljust(8, b'\x00')),
+                              ("model = ?", model and model.name),
+                              ("data_length >= ?", min_length), ("data_length <= ?", max_length)):
+            if value is not None:
+                clauses.append(clause)
+                parameters.append(value)
+
+        if containing is not None:
+            if not self.store_data:
+                raise ValueError("catalog does not store entry data")
+
+            clauses.append("instr(data, ?) > 0")
+            parameters.append(containing)
+
+        return self.query(" AND ".join(clauses), tuple(parameters))
+
+
+__all__ = ["Catalog", "CatalogEntry"]
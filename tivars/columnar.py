@@ -0,0 +1,97 @@
+import re
+
+from array import array
+from typing import ByteString, Iterable, Iterator
+
+from .var import TIEntry, TIVarIndex, buffer
+
+
+# Entries are stored column by column: one buffer holds every data section back to back,
+# and each meta field is kept in a fixed-width column, so an entry costs its data plus 22 bytes
+class EntryBatch:
+    def __init__(self, entries: Iterable[TIEntry] = ()):
+        self.data = bytearray()
+        self.offsets = array('Q')
+        self.lengths = array('H')
+
+        self.meta_lengths = bytearray()
+        self.type_ids = bytearray()
+        self.names = bytearray()
+        self.versions = bytearray()
+        self.archived = bytearray()
+
+        self.extend(entries)
+
+    def __getitem__(self, index: int) -> TIEntry:
+        index = range(len(self))[index]
+        return TIEntry.from_raw(self.meta(index), self._data(index))
+
+    def __iter__(self) -> Iterator[TIEntry]:
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _data(self, index: int) -> bytearray:
+        return self.data[self.offsets[index]:self.offsets[index] + self.lengths[index]]
+
+    def _append(self, meta_length: int, meta: ByteString, data: ByteString):
+        self.offsets.append(len(self.data))
+        self.lengths.append(len(data))
+        self.data += data
+
+        self.meta_lengths.append(meta_length)
+        self.type_ids += meta[0:1]
+        self.names += meta[1:9]
+        self.versions += meta[9:10] or b'\x00'
+        self.archived += meta[10:11] or b'\x00'
+
+    def append(self, entry: TIEntry):
+        raw = entry.raw
+        self._append(int.from_bytes(raw.meta_length, 'little'),
+                     raw.type_id + raw.name + raw.version + raw.archived, raw.peek("data"))
+
+    def add_var_bytes(self, data: ByteString):
+        # Entries are copied straight out of the var file without being built
+        data = buffer(data)
+
+        index = TIVarIndex()
+        index.load_var_bytes(data)
+
+        for record in index:
+            start = record.offset + 4 + record.meta_length
+            self._append(record.meta_length, data[record.offset + 4:start - 2], data[start:start + record.data_length])
+
+    def extend(self, entries: Iterable[TIEntry]):
+        for entry in entries:
+            self.append(entry)
+
+    def meta(self, index: int) -> bytes:
+        # Laid out as in a var file, for from_raw
+        index = range(len(self))[index]
+        return (int.to_bytes(self.lengths[index], 2, 'little') + self.type_ids[index:index + 1] +
+                self.names[8 * index:8 * index + 8] + self.versions[index:index + 1] +
+                self.archived[index:index + 1])[:self.meta_lengths[index]]
+
+    def name(self, index: int) -> bytes:
+        index = range(len(self))[index]
+        return bytes(self.names[8 * index:8 * index + 8])
+
+    def take(self, indices: Iterable[int]) -> 'EntryBatch':
+        batch = EntryBatch()
+
+        for index in indices:
+            batch._append(self.meta_lengths[index], self.meta(index)[2:], self._data(index))
+
+        return batch
+
+    def where(self, *type_ids: bytes) -> list[int]:
+        # The type ID column is scanned in one pass by the regex engine
+        pattern = re.compile(b'[' + b''.join(re.escape(type_id) for type_id in type_ids) + b']')
+        return [match.start() for match in pattern.finditer(self.type_ids)]
+
+    def filter(self, *type_ids: bytes) -> 'EntryBatch':
+        return self.take(self.where(*type_ids))
+
+
+__all__ = ["EntryBatch"]
@@ -103,6 +103,10 @@ class Section:
     def __set__(self, instance, value: _T):
         value = self._set(value, instance)
 
+        # Buffers are copied, so that later writes to them don't bypass the entry
+        if isinstance(value, bytearray | memoryview):
+            value = bytearray(value)
+
         if self._length is not None:
             if len(value) > self._length:
                 warn(f"Value {value} is too wide for this buffer; truncating to {value[:self._length]}.",
@@ -113,6 +117,9 @@ class Section:
 
         setattr(instance.raw, self._name, value)
 
+        if hasattr(instance.raw, "modified"):
+            instance.raw.modified(self._name)
+
     def __call__(self, func) -> 'Section':
         new = copy.copy(self)
         new.__doc__ = func.__doc__
@@ -125,6 +132,10 @@ class Section:
 
         return new
 
+    @property
+    def converter(self) -> type[Converter]:
+        return self._converter
+
     @property
     def name(self) -> str:
         return self._name
@@ -145,7 +156,9 @@ class View(Section):
         if instance is None:
             return self
 
-        return self._get(getattr(instance.raw, self._target.name)[self._indices], instance)
+        raw = instance.raw
+        buffer = raw.peek(self._target.name) if hasattr(raw, "peek") else getattr(raw, self._target.name)
+        return self._get(buffer[self._indices], instance)
 
     def __set__(self, instance, value: _T):
         value = self._set(value, instance)
@@ -153,11 +166,24 @@ class View(Section):
         if self.length is not None:
             value = value[:self.length].rjust(self.length, b'\x00')
 
-        getattr(instance.raw, self._target.name)[self._indices] = value
+        if hasattr(instance.raw, "splice"):
+            # Shared buffers are copied on their first write
+            instance.raw.splice(self._target.name, self._indices, value)
+
+        else:
+            getattr(instance.raw, self._target.name)[self._indices] = value
 
     def __getitem__(self, indices: slice) -> 'View':
         return self.__class__(self._target, self._converter, indices)
 
+    @property
+    def indices(self) -> slice:
+        return self._indices
+
+    @property
+    def target(self) -> Section:
+        return self._target
+
     @property
     def length(self) -> int | None:
         if self._target.length is None:
@@ -0,0 +1,155 @@
+from copy import copy
+from io import BytesIO
+from typing import ByteString
+
+from .var import TIEntry, TIHeader, TIVar, buffer
+
+
+# A delta starts with the magic, the new header if it changed, and the number of entries in the new var
+# Each new entry is then either copied whole from an old entry, or patched from one:
+#   0x00, old index (2)
+#   0x01, old index (2; 0xFFFF for none), meta length (1), meta, op count (2), ops
+# Patches rebuild the data section from copies of the old entry's data and inserted bytes:
+#   0x00, offset (2), length (2)
+#   0x01, length (2), bytes
+magic = b'TIVD'
+
+COPY, PATCH = 0, 1
+COPY_DATA, INSERT_DATA = 0, 1
+
+NO_BASE = 0xFFFF
+
+window = 8
+
+
+def _data_ops(old: bytes, new: bytes) -> list[tuple]:
+    # Matches are found greedily on short windows, as in xdelta, and extended as far as they go
+    # Windows which continue the last match are tried first, so unedited runs become a single copy
+    positions = {}
+    for j in range(len(old) - window, -1, -1):
+        positions[old[j:j + window]] = j
+
+    ops, start, i, expected = [], 0, 0, 0
+    while i <= len(new) - window:
+        key = new[i:i + window]
+        j = expected if old[expected:expected + window] == key else positions.get(key)
+
+        if j is None:
+            i += 1
+            continue
+
+        while i > start and j > 0 and new[i - 1] == old[j - 1]:
+            i, j = i - 1, j - 1
+
+        length = window
+        while i + length < len(new) and j + length < len(old) and new[i + length] == old[j + length]:
+            length += 1
+
+        if i > start:
+            ops.append((INSERT_DATA, new[start:i]))
+
+        ops.append((COPY_DATA, j, length))
+        start = i = i + length
+        expected = j + length
+
+    if start < len(new):
+        ops.append((INSERT_DATA, new[start:]))
+
+    return ops
+
+
+def diff(old: TIVar, new: TIVar) -> bytes:
+    parts = [magic]
+
+    # Header
+    if new.header.bytes() != old.header.bytes():
+        parts += [b'\x01', new.header.bytes()]
+
+    else:
+        parts.append(b'\x00')
+
+    # Entries
+    old_entries = old.entries
+    digests, names = {}, {}
+    for old_index, old_entry in enumerate(old_entries):
+        digests.setdefault(old_entry.digest, old_index)
+        names.setdefault((old_entry.raw.type_id, old_entry.raw.name), old_index)
+
+    parts.append(int.to_bytes(len(new.entries), 2, 'little'))
+    for index, entry in enumerate(new.entries):
+        if entry.digest in digests:
+            parts += [bytes([COPY]), int.to_bytes(digests[entry.digest], 2, 'little')]
+            continue
+
+        # Patch from an old entry with the same type and name, else whichever sits in the same place
+        base = names.get((entry.raw.type_id, entry.raw.name), index if index < len(old_entries) else NO_BASE)
+        ops = _data_ops(bytes(old_entries[base].raw.peek("data")) if base != NO_BASE else b'',
+                        bytes(entry.raw.peek("data")))
+
+        meta = entry.raw.meta[2:]
+        parts += [bytes([PATCH]), int.to_bytes(base, 2, 'little'), bytes([len(meta)]), meta,
+                  int.to_bytes(len(ops), 2, 'little')]
+
+        for op in ops:
+            if op[0] == COPY_DATA:
+                parts += [bytes([COPY_DATA]), int.to_bytes(op[1], 2, 'little'), int.to_bytes(op[2], 2, 'little')]
+
+            else:
+                parts += [bytes([INSERT_DATA]), int.to_bytes(len(op[1]), 2, 'little'), op[1]]
+
+    return b''.join(parts)
+
+
+def apply(old: TIVar, delta: ByteString | BytesIO) -> TIVar:
+    delta = buffer(delta)
+
+    if delta[:4] != magic:
+        raise ValueError("data is not a var delta")
+
+    def read(length: int) -> memoryview:
+        nonlocal offset
+        offset += length
+        return delta[offset - length:offset]
+
+    def read_int(length: int) -> int:
+        return int.from_bytes(read(length), 'little')
+
+    offset = 4
+
+    # Header
+    if read_int(1):
+        header = TIHeader()
+        header.load_bytes(read(53))
+
+    else:
+        header = copy(old.header)
+
+    new = TIVar(header=header, name=old.name, model=header.derive_model())
+
+    # Entries
+    old_entries = old.entries
+    for _ in range(read_int(2)):
+        if read_int(1) == COPY:
+            new.add_entry(copy(old_entries[read_int(2)]))
+            continue
+
+        base = read_int(2)
+        old_data = old_entries[base].raw.peek("data") if base != NO_BASE else b''
+        meta = read(read_int(1))
+
+        data = bytearray()
+        for _ in range(read_int(2)):
+            if read_int(1) == COPY_DATA:
+                start = read_int(2)
+                data += old_data[start:start + read_int(2)]
+
+            else:
+                data += read(read_int(2))
+
+        # The checksum is derived anew from the rebuilt entries
+        new.add_entry(TIEntry.from_raw(b'\x00\x00' + bytes(meta), data))
+
+    return new
+
+
+__all__ = ["diff", "apply"]
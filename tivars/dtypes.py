@@ -0,0 +1,71 @@
+from functools import cache
+
+from .data import Converter, Integer, String, View
+from .var import TIEntry
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+
+def _format(converter: type[Converter], length: int):
+    if converter is Integer and length in (1, 2, 4, 8):
+        return f"<u{length}"
+
+    if converter is String:
+        return f"S{length}"
+
+    # Entry types used as converters (e.g. the reals in settings) become nested records
+    if isinstance(converter, type) and issubclass(converter, TIEntry):
+        if (nested := entry_dtype(converter)).itemsize == length and nested.names:
+            return nested
+
+    return ("u1", length) if length > 1 else "u1"
+
+
+@cache
+def entry_dtype(entry_type: type[TIEntry]) -> 'np.dtype':
+    if np is None:
+        raise ImportError("NumPy is required to build entry dtypes")
+
+    # Later definitions in the MRO override earlier ones, as with attribute lookup
+    views = {}
+    for cls in reversed(entry_type.__mro__):
+        for name, attr in vars(cls).items():
+            if isinstance(attr, View):
+                views[name] = attr
+
+            else:
+                views.pop(name, None)
+
+    data_length = entry_type.data.length
+
+    # Only views of the data section with fixed bounds have fixed offsets
+    fields = []
+    for name, view in views.items():
+        if view.target.name != "data" or (view.indices.step or 1) != 1:
+            continue
+
+        if data_length is not None:
+            start, stop, _ = view.indices.indices(data_length)
+
+        elif (view.indices.start or 0) >= 0 and view.indices.stop is not None and view.indices.stop >= 0:
+            start, stop = view.indices.start or 0, view.indices.stop
+
+        else:
+            continue
+
+        if stop > start:
+            fields.append((start, stop, name, view.converter))
+
+    fields.sort()
+    return np.dtype({"names": [name for _, _, name, _ in fields],
+                     "formats": [_format(converter, stop - start) for start, stop, _, converter in fields],
+                     "offsets": [start for start, _, _, _ in fields],
+                     "itemsize": data_length if data_length is not None else max((stop for _, stop, _, _ in fields),
+                                                                                   default=0)})
+
+
+__all__ = ["entry_dtype"]
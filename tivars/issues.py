@@ -0,0 +1,87 @@
+from collections import Counter, namedtuple
+from contextvars import ContextVar
+from warnings import warn
+
+
+class Issue(namedtuple("Issue", ["code", "category", "entry", "offset", "template", "args"])):
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return self.message
+
+    @property
+    def message(self) -> str:
+        return self.template.format(*self.args)
+
+
+class DiagnosticError(ValueError):
+    def __init__(self, issue: Issue):
+        super().__init__(issue.message)
+        self.issue = issue
+
+
+class Diagnostics:
+    modes = "warn", "collect", "strict", "silent"
+
+    def __init__(self, mode: str = "collect"):
+        if mode not in self.modes:
+            raise ValueError(f"mode must be one of {', '.join(self.modes)}")
+
+        self.mode = mode
+        self.issues = []
+        self.counts = Counter()
+
+        self._tokens = []
+
+    def __enter__(self) -> 'Diagnostics':
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._tokens.pop())
+
+    def __len__(self) -> int:
+        return self.counts.total()
+
+    def add(self, code: str, template: str, args: tuple, category: type[Warning], entry, offset: int | None):
+        self.counts[code] += 1
+
+        match self.mode:
+            case "silent":
+                pass
+
+            case "collect":
+                self.issues.append(Issue(code, category, _describe(entry), offset, template, args))
+
+            case "strict":
+                raise DiagnosticError(Issue(code, category, _describe(entry), offset, template, args))
+
+            case "warn":
+                warn(template.format(*args), category, stacklevel=3)
+
+
+_current = ContextVar("diagnostics", default=None)
+
+
+def _describe(entry) -> tuple[str, bytes] | None:
+    # Issues only keep the entry's type and name, so collecting them doesn't keep every flagged entry alive
+    if entry is None:
+        return None
+
+    return type(entry).__name__, getattr(entry.raw, "name", None)
+
+
+def diagnostics(mode: str = "collect") -> Diagnostics:
+    return Diagnostics(mode)
+
+
+def report(code: str, template: str, *args, category: type[Warning] = BytesWarning, entry=None, offset: int = None):
+    # The message is only formatted if it is warned or asked for
+    if (current := _current.get()) is None:
+        warn(template.format(*args), category, stacklevel=2)
+
+    else:
+        current.add(code, template, args, category, entry, offset)
+
+
+__all__ = ["diagnostics", "Diagnostics", "DiagnosticError", "Issue"]
@@ -0,0 +1,117 @@
+import json
+import os
+
+from collections import namedtuple
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator
+
+from .var import TIVar
+
+
+CorpusRecord = namedtuple("CorpusRecord", ["path", "offset", "length"])
+
+
+# Corpora attached by this process, so each block is only mapped and indexed once however many tasks it is sent to
+_attached = {}
+
+
+# The block starts with the length of the index, then the index itself as JSON, then each file's bytes back to back
+class SharedCorpus:
+    def __init__(self, block: SharedMemory, records: list[CorpusRecord], *, owner: bool = False):
+        self.block = block
+        self.records = records
+        self.owner = owner
+
+        self._lookup = {record.path: index for index, record in enumerate(records)}
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._lookup
+
+    def __enter__(self) -> 'SharedCorpus':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getitem__(self, key: int | str) -> TIVar:
+        return self.var(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (record.path for record in self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __reduce__(self):
+        # Only the block's name is sent to workers; they attach to it and read the index from the block
+        return attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self.block.name
+
+    @classmethod
+    def load(cls, paths: Iterable[str], *, name: str = None) -> 'SharedCorpus':
+        paths = list(paths)
+        lengths = [os.path.getsize(path) for path in paths]
+
+        offset, records = 0, []
+        for path, length in zip(paths, lengths):
+            records.append(CorpusRecord(path, offset, length))
+            offset += length
+
+        # Offsets are taken from the start of the file data so that the index doesn't depend on its own length
+        index = json.dumps(records).encode()
+        start = 8 + len(index)
+
+        block = SharedMemory(name, create=True, size=start + offset)
+
+        try:
+            block.buf[:start] = int.to_bytes(len(index), 8, 'little') + index
+            for record in records:
+                with open(record.path, 'rb') as file:
+                    file.readinto(block.buf[start + record.offset:start + record.offset + record.length])
+
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+
+        return cls(block, [record._replace(offset=start + record.offset) for record in records], owner=True)
+
+    def close(self):
+        # Any vars or entries still viewing the block must be released first
+        if self.owner:
+            self.block.close()
+            self.block.unlink()
+
+    def view(self, key: int | str) -> memoryview:
+        record = self.records[self._lookup[key] if isinstance(key, str) else key]
+        return self.block.buf[record.offset:record.offset + record.length].toreadonly()
+
+    def var(self, key: int | str) -> TIVar:
+        var = TIVar()
+        var.load_view(self.view(key))
+        return var
+
+
+def attach(name: str) -> SharedCorpus:
+    if name not in _attached:
+        try:
+            block = SharedMemory(name, track=False)
+
+        except TypeError:
+            # Before Python 3.13, attaching registers the block with the resource tracker too
+            # Workers share their parent's tracker, so this leaves the block to its owner all the same
+            block = SharedMemory(name)
+
+        start = 8 + int.from_bytes(block.buf[:8], 'little')
+        records = [CorpusRecord(path, start + offset, length)
+                   for path, offset, length in json.loads(bytes(block.buf[8:start]))]
+
+        _attached[name] = SharedCorpus(block, records)
+
+    return _attached[name]
+
+
+__all__ = ["attach", "CorpusRecord", "SharedCorpus"]
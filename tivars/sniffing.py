@@ -0,0 +1,73 @@
+from collections import namedtuple
+from typing import BinaryIO, ByteString
+
+from tivars.models import *
+from .types import *
+from .types.list import ListEntry
+from .types.picture import PictureEntry
+from .var import TIEntry, TIHeader, SizedEntry, reader
+
+
+SniffResult = namedtuple("SniffResult", ["entry_type", "model", "dimensions"])
+
+
+GDB_TYPES = {
+    TIMonoFuncGDB.mode_byte: (TIMonoFuncGDB, TIFuncGDB),
+    TIMonoParamGDB.mode_byte: (TIMonoParamGDB, TIParamGDB),
+    TIMonoPolarGDB.mode_byte: (TIMonoPolarGDB, TIPolarGDB),
+    TIMonoSeqGDB.mode_byte: (TIMonoSeqGDB, TISeqGDB)
+}
+
+PICTURE_TYPES = {picture_type.min_data_length: picture_type for picture_type in (TIMonoPicture, TIPicture, TIImage)}
+
+
+def sniff(source: str | BinaryIO | ByteString, *, size: int = 96) -> SniffResult:
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            return sniff(file, size=size)
+
+    # The header and first entry's meta fit in a single small read
+    read = reader(source)
+    head = read(0, size)
+
+    header = TIHeader()
+    header.load_bytes(head[:53])
+    model = header.derive_model()
+
+    meta_length = int.from_bytes(head[55:57], 'little')
+    data_length = int.from_bytes(head[57:59], 'little')
+    data_offset = 59 + meta_length
+    data = head[data_offset:]
+
+    entry_type = TIEntry.type_ids.get(bytes(head[59:60]), TIEntry)
+    dimensions = {}
+
+    # Narrow down the entry type the same way coerce would, from the first few data bytes
+    if issubclass(entry_type, ListEntry):
+        dimensions["length"] = int.from_bytes(data[0:2], 'little')
+
+    elif issubclass(entry_type, TIMatrix):
+        dimensions["width"], dimensions["height"] = data[0], data[1]
+
+    elif issubclass(entry_type, PictureEntry):
+        entry_type = PICTURE_TYPES.get(int.from_bytes(data[0:2], 'little') + 2, entry_type)
+        dimensions["width"], dimensions["height"] = entry_type.width, entry_type.height
+
+    elif issubclass(entry_type, TIMonoGDB):
+        if len(data) > 3 and data[3] in GDB_TYPES:
+            mono_type, color_type = GDB_TYPES[data[3]]
+
+            # Color GDBs end with a fixed-size block starting with 84C
+            entry_type = mono_type
+            if read(data_offset + data_length - mono_type.num_styles - 8, 3) == b'84C':
+                entry_type = color_type
+
+            dimensions["mode_id"] = data[3]
+
+    elif issubclass(entry_type, SizedEntry):
+        dimensions["length"] = int.from_bytes(data[0:2], 'little')
+
+    return SniffResult(entry_type, model, dimensions)
+
+
+__all__ = ["sniff", "SniffResult"]
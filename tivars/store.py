@@ -0,0 +1,159 @@
+import hashlib
+import os
+import sqlite3
+
+from typing import ByteString, Iterator
+
+from .var import TIVar, TIVarIndex
+
+
+# Entry data sections are kept once in append-only pack files, keyed by their digest
+# Var files are kept as manifests which splice their remaining bytes (header, entry meta, checksum) with payload digests
+class VarStore:
+    digest_size = 32
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS payloads (
+            digest BLOB PRIMARY KEY,
+            pack INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            length INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS manifests (
+            key TEXT PRIMARY KEY,
+            manifest BLOB NOT NULL
+        );
+    """
+
+    def __init__(self, directory: str, *, pack_size: int = 1 << 26):
+        self.directory = directory
+        self.pack_size = pack_size
+
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(directory, "index.db"))
+        self.connection.executescript(self.schema)
+
+        self.pack = self.connection.execute("SELECT COALESCE(MAX(pack), 0) FROM payloads").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.connection.execute("SELECT 1 FROM manifests WHERE key = ?", (key,)).fetchone() is not None
+
+    def __enter__(self) -> 'VarStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, in self.connection.execute("SELECT key FROM manifests ORDER BY key"))
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def pack_path(self, pack: int) -> str:
+        return os.path.join(self.directory, f"pack-{pack:04d}.pack")
+
+    @staticmethod
+    def data_sections(data: memoryview) -> Iterator[tuple[int, int]]:
+        index = TIVarIndex()
+        index.load_var_bytes(data)
+
+        start = 55
+        for record in index:
+            # Entries with inconsistent lengths are kept verbatim in the manifest
+            data_start = record.offset + 4 + record.meta_length
+            data_end = min(data_start + record.data_length, len(data))
+            if data_start >= start and data_end > data_start:
+                yield data_start, data_end
+                start = data_end
+
+    def add(self, data: ByteString | TIVar) -> str:
+        try:
+            data = memoryview(data.bytes())
+
+        except AttributeError:
+            data = memoryview(data)
+
+        key = hashlib.sha256(data).hexdigest()
+        if key in self:
+            return key
+
+        manifest, start = bytearray(), 0
+        with self.connection:
+            for data_start, data_end in self.data_sections(data):
+                manifest += b'L' + int.to_bytes(data_start - start, 4, 'little') + data[start:data_start]
+                manifest += b'P' + self.put(data[data_start:data_end])
+                start = data_end
+
+            manifest += b'L' + int.to_bytes(len(data) - start, 4, 'little') + data[start:]
+            self.connection.execute("INSERT INTO manifests VALUES (?, ?)", (key, bytes(manifest)))
+
+        return key
+
+    def add_file(self, filename: str) -> str:
+        with open(filename, 'rb') as file:
+            return self.add(file.read())
+
+    def put(self, payload: ByteString) -> bytes:
+        digest = hashlib.sha256(payload).digest()
+        if self.connection.execute("SELECT 1 FROM payloads WHERE digest = ?", (digest,)).fetchone() is not None:
+            return digest
+
+        if os.path.exists(path := self.pack_path(self.pack)) and os.path.getsize(path) >= self.pack_size:
+            self.pack += 1
+            path = self.pack_path(self.pack)
+
+        with open(path, 'ab') as file:
+            offset = file.tell()
+            file.write(payload)
+
+        self.connection.execute("INSERT INTO payloads VALUES (?, ?, ?, ?)", (digest, self.pack, offset, len(payload)))
+        return digest
+
+    def payload(self, digest: bytes) -> bytes:
+        try:
+            pack, offset, length = self.connection.execute(
+                "SELECT pack, offset, length FROM payloads WHERE digest = ?", (digest,)).fetchone()
+
+        except TypeError:
+            raise KeyError(f"payload {digest.hex()} not found")
+
+        with open(self.pack_path(pack), 'rb') as file:
+            file.seek(offset)
+            return file.read(length)
+
+    def bytes(self, key: str) -> bytes:
+        try:
+            manifest, = self.connection.execute("SELECT manifest FROM manifests WHERE key = ?", (key,)).fetchone()
+
+        except TypeError:
+            raise KeyError(f"var {key} not found")
+
+        parts, index = [], 0
+        while index < len(manifest):
+            match manifest[index:index + 1]:
+                case b'L':
+                    length = int.from_bytes(manifest[index + 1:index + 5], 'little')
+                    parts.append(manifest[index + 5:index + 5 + length])
+                    index += 5 + length
+
+                case b'P':
+                    parts.append(self.payload(manifest[index + 1:index + 1 + self.digest_size]))
+                    index += 1 + self.digest_size
+
+                case _:
+                    raise ValueError(f"corrupt manifest for var {key}")
+
+        return b''.join(parts)
+
+    def get(self, key: str) -> TIVar:
+        var = TIVar()
+        var.load_bytes(self.bytes(key))
+        return var
+
+
+__all__ = ["VarStore"]
@@ -29,7 +29,7 @@ def decode(bytestream: ByteString, byte_map: ByteMap) -> str:
 
 def encode(string: str, token_map: TokenMap) -> bytes:
     data = b''
-    max_length = max(map(len, token_map.keys()))
+    max_length = token_map.max_length if isinstance(token_map, TokenMap) else max(map(len, token_map.keys()))
     within_string = False
 
     index = 0
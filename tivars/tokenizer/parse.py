@@ -1,13 +1,23 @@
 import xml.parsers.expat
 
 from collections import namedtuple
+from functools import cached_property
 
 
 TokenAttributes = namedtuple("TokenAttributes", ["bytes", "terminator"])
-TokenMap = dict[str, TokenAttributes]
 ByteMap = dict[bytes, list[str]]
 
 
+class TokenMap(dict[str, TokenAttributes]):
+    def __setitem__(self, key: str, value: TokenAttributes):
+        super().__setitem__(key, value)
+        self.__dict__.pop("max_length", None)
+
+    @cached_property
+    def max_length(self) -> int:
+        return max(map(len, self.keys()))
+
+
 def load_tokens_xml(filename: str) -> tuple[TokenMap, ByteMap]:
     def load_token(name, attributes):
         nonlocal curr_name
@@ -41,7 +51,7 @@ def load_tokens_xml(filename: str) -> tuple[TokenMap, ByteMap]:
                 curr_name = None
                 curr_bytes = curr_bytes[:-1]
 
-    token_map = {}
+    token_map = TokenMap()
     byte_map = {}
 
     curr_name = None
@@ -58,14 +58,14 @@ TIEntry.register(TIImage)
 
 
 __all__ = ["TIEntry",
-           "TIReal", "FloatFlags",
+           "TIReal", "TIRealView", "FloatFlags",
            "TIRealList", "TIMatrix",
            "TIEquation", "TIString", "TIProgram", "TIProtectedProgram",
            "TIPicture", "TIMonoPicture",
            "TIMonoGDB", "TIMonoFuncGDB", "TIMonoParamGDB", "TIMonoPolarGDB", "TIMonoSeqGDB",
            "TIFuncGDB", "TIParamGDB", "TIPolarGDB", "TISeqGDB",
            "GraphMode", "GraphStyle", "GraphColor", "GlobalLineStyle",
-           "TIComplex", "TIComplexList",
+           "TIComplex", "TIComplexView", "TIComplexList",
            "TIWindowSettings", "TIRecallWindow", "TITableSettings",
            "TIImage"
            ]
@@ -8,6 +8,7 @@ from tivars.models import *
 from tivars.tokenizer import decode, encode
 from ..flags import *
 from ..data import *
+from ..issues import report
 from ..var import TIEntry
 from .numeric import TIReal
 from .tokenized import TIEquation
@@ -117,12 +118,17 @@ class EquationFlags(Flags):
 
 class TIGraphedEquation(TIEquation):
     class Raw(TIEntry.Raw):
-        __slots__ = "meta_length", "type_id", "name", "version", "archived", "flags", "style", "color", "data"
+        __slots__ = "flags", "style", "color"
 
-        def bytes(self) -> bytes:
-            return self.meta_length + self.data_length + \
-                self.type_id + self.name + self.version + self.archived + \
-                self.data_length + self.flags + self.data
+        def parts(self) -> list[ByteString]:
+            data_length = self.data_length
+            return [self.meta_length, data_length,
+                    self.type_id, self.name, self.version, self.archived,
+                    data_length, self.flags, self._data]
+
+        @property
+        def checksum(self) -> int:
+            return super().checksum + sum(self.flags)
 
     def __init__(self, init=None, *,
                  for_flash: bool = True, name: str = "Y1",
@@ -149,11 +155,11 @@ class TIGraphedEquation(TIEquation):
                 equations = list(instance.equations)
                 equations[index] = value
 
-                data = instance.raw.data[:instance.offset]
+                data = bytearray(instance.raw.peek("data")[:instance.offset])
                 for i in range(0, instance.num_equations, instance.num_equations // instance.num_styles):
                     data += equations[i].style
 
-                data += b''.join(equation.raw.flags + equation.raw.data for equation in equations)
+                data += b''.join(equation.raw.flags + equation.raw.peek("data") for equation in equations)
 
                 if color := color_data(instance):
                     data += b'84C'
@@ -252,7 +258,7 @@ class TIGraphedEquation(TIEquation):
 
 
 def color_data(gdb: 'TIMonoGDB') -> bytes:
-    data = io.BytesIO(gdb.data[gdb.offset + gdb.num_styles:])
+    data = io.BytesIO(gdb.raw.peek("data")[gdb.offset + gdb.num_styles:])
     for i in range(gdb.num_equations):
         TIGraphedEquation().load_data_section(data)
 
@@ -384,8 +390,7 @@ class TIMonoGDB(TIEntry):
                 return 'Sequence'
 
             case _:
-                warn(f"Graphing mode byte 0x{self.mode_id:x} not recognized.",
-                     BytesWarning)
+                report("mode", "Graphing mode byte 0x{:x} not recognized.", self.mode_id, entry=self)
 
     @property
     def offset(self) -> int:
@@ -397,7 +402,7 @@ class TIMonoGDB(TIEntry):
         The GDB's stored graph equations
         """
 
-        data = io.BytesIO(self.data[self.offset:])
+        data = io.BytesIO(self.raw.peek("data")[self.offset:])
         equations = tuple(TIGraphedEquation(name=name) for name in self.equation_names)
 
         for i in range(self.num_styles):
@@ -422,12 +427,12 @@ class TIMonoGDB(TIEntry):
     @Loader[dict]
     def load_dict(self, dct: dict):
         self.clear()
-        self.raw.data[3] = {
+        self.raw.splice("data", slice(3, 4), bytes([{
             'Function': 0x10,
             'Parametric': 0x40,
             'Polar': 0x20,
             'Sequence': 0x80
-        }.get(mode := dct.get("graphMode", "Function"), 0x00)
+        }.get(mode := dct.get("graphMode", "Function"), 0x00)]))
 
         for setting in dct.get("formatSettings", []):
             try:
@@ -440,7 +445,7 @@ class TIMonoGDB(TIEntry):
         if "showExpr" in ext_settings:
             self.extended_mode_flags |= GraphMode.ExprOn if ext_settings["showExpr"] else GraphMode.ExprOff
 
-        if self.raw.data[3] != 0x80:
+        if self.raw.peek("data")[3] != 0x80:
             if "seqMode" in ext_settings or "seqSettings" in dct:
                 warn(f"Sequence settings have been provided, but this GDB is for {mode.lower()} graphs.",
                      UserWarning)
@@ -529,8 +534,7 @@ class TIMonoGDB(TIEntry):
                     self.__class__ = TIMonoSeqGDB
 
                 case _:
-                    warn(f"Graphing mode byte 0x{self.mode_id:x} not recognized.",
-                         BytesWarning)
+                    report("mode", "Graphing mode byte 0x{:x} not recognized.", self.mode_id, entry=self)
 
             self.set_length()
 
@@ -636,8 +640,7 @@ class TIGDB(TIMonoGDB):
                 self.__class__ = TISeqGDB
 
             case _:
-                warn(f"Graphing mode byte 0x{self.mode_id:x} not recognized.",
-                     BytesWarning)
+                report("mode", "Graphing mode byte 0x{:x} not recognized.", self.mode_id, entry=self)
 
         self.set_length()
 
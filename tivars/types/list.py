@@ -7,8 +7,9 @@ from warnings import warn
 from tivars.models import *
 from tivars.tokenizer import TokenizedString
 from ..data import *
+from ..issues import report
 from ..var import TIEntry
-from .numeric import TIReal, TIComplex
+from .numeric import TIReal, TIComplex, TIRealView, TIComplexView
 
 
 class ListName(TokenizedString):
@@ -46,6 +47,7 @@ class ListName(TokenizedString):
 
 class ListEntry(TIEntry):
     _E = TIEntry
+    _V = None
 
     min_data_length = 2
 
@@ -58,9 +60,9 @@ class ListEntry(TIEntry):
     def __format__(self, format_spec: str) -> str:
         match format_spec:
             case "":
-                return "[" + ", ".join(format(entry, format_spec) for entry in self.list()) + "]"
+                return "[" + ", ".join(format(entry, format_spec) for entry in self.views()) + "]"
             case "t":
-                return "{" + ",".join(format(entry, 't') for entry in self.list()) + "}"
+                return "{" + ",".join(format(entry, 't') for entry in self.views()) + "}"
             case _:
                 return super().__format__(format_spec)
 
@@ -104,9 +106,8 @@ class ListEntry(TIEntry):
         super().load_bytes(data)
 
         if self.data_length // self._E.min_data_length != self.length:
-            warn(f"The list has an unexpected length "
-                 f"(expected {self.data_length // self._E.min_data_length}, got {self.length}).",
-                 BytesWarning)
+            report("list_length", "The list has an unexpected length (expected {}, got {}).",
+                   self.data_length // self._E.min_data_length, self.length, entry=self)
 
     def load_data_section(self, data: BytesIO):
         data_length = int.from_bytes(length_bytes := data.read(2), 'little')
@@ -117,17 +118,17 @@ class ListEntry(TIEntry):
         self.load_bytes(int.to_bytes(len(lst), 2, 'little') + b''.join(entry.data for entry in lst))
 
     def list(self) -> list[_E]:
-        lst = []
-        for i in range(self.length):
-            entry = self._E()
+        template = self._E()
+        template.meta_length = self.meta_length
+        template.archived = self.archived
 
-            entry.meta_length = self.meta_length
-            entry.archived = self.archived
+        meta, length = template.raw.meta, template.data_length
+        return [self._E.from_raw(meta, self.raw.peek("data")[length * i + 2:][:length]) for i in range(self.length)]
 
-            entry.data = self.data[entry.data_length * i + 2:][:entry.data_length]
-            lst.append(entry)
-
-        return lst
+    def views(self) -> Iterator:
+        # Each view reads and writes the list's own data section, so no entries are built
+        for i in range(self.length):
+            yield self._V(self, self._E.min_data_length * i + 2)
 
     @Loader[str]
     def load_string(self, string: str):
@@ -146,6 +147,7 @@ class ListEntry(TIEntry):
 
 class TIRealList(ListEntry):
     _E = TIReal
+    _V = TIRealView
 
     extensions = {
         None: "8xl",
@@ -169,6 +171,7 @@ class TIRealList(ListEntry):
 
 class TIComplexList(ListEntry):
     _E = TIComplex
+    _V = TIComplexView
 
     extensions = {
         None: "8xl",
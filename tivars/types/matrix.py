@@ -1,11 +1,11 @@
 from io import BytesIO
 from typing import ByteString, Iterator
-from warnings import warn
 
 from tivars.models import *
 from ..data import *
+from ..issues import report
 from ..var import TIEntry
-from .numeric import TIReal
+from .numeric import TIReal, TIRealView
 
 
 class TIMatrix(TIEntry):
@@ -46,7 +46,7 @@ class TIMatrix(TIEntry):
                 return super().__format__(format_spec)
 
         return "[" + outer_sep.join(f"[{inner_sep.join(format(entry, format_spec)for entry in row)}]"
-                                    for row in self.matrix()) + "]"
+                                    for row in self.views()) + "]"
 
     def __iter__(self) -> Iterator[TIReal]:
         for row in self.matrix():
@@ -86,9 +86,8 @@ class TIMatrix(TIEntry):
         super().load_bytes(data)
 
         if self.data_length // TIReal.min_data_length != self.size:
-            warn(f"The matrix has an unexpected size "
-                 f"(expected {self.data_length // TIReal.min_data_length}, got {self.size}).",
-                 BytesWarning)
+            report("matrix_size", "The matrix has an unexpected size (expected {}, got {}).",
+                   self.data_length // TIReal.min_data_length, self.size, entry=self)
 
     def load_data_section(self, data: BytesIO):
         width = int.from_bytes(width_byte := data.read(1), 'little')
@@ -104,22 +103,20 @@ class TIMatrix(TIEntry):
                         b''.join(entry.data for row in matrix for entry in row))
 
     def matrix(self) -> list[list[TIReal]]:
-        matrix = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                entry = TIReal()
+        template = TIReal()
+        template.meta_length = self.meta_length
+        template.archived = self.archived
 
-                entry.meta_length = self.meta_length
-                entry.archived = self.archived
+        meta, length, data = template.raw.meta, template.data_length, self.raw.peek("data")
+        return [[TIReal.from_raw(meta, data[length * (self.width * i + j) + self.min_data_length:][:length])
+                 for j in range(self.width)]
+                for i in range(self.height)]
 
-                index = self.width * i + j
-                entry.data = self.data[entry.data_length * index + self.min_data_length:][:entry.data_length]
-                row.append(entry)
-
-            matrix.append(row.copy())
-
-        return matrix
+    def views(self) -> Iterator[Iterator[TIRealView]]:
+        # Each view reads and writes the matrix's own data section, so no entries are built
+        for i in range(self.height):
+            yield (TIRealView(self, TIReal.min_data_length * (self.width * i + j) + self.min_data_length)
+                   for j in range(self.width))
 
     @Loader[str]
     def load_string(self, string: str):
@@ -1,11 +1,10 @@
 import copy
 import decimal as dec
 
-from warnings import warn
-
 from tivars.models import *
 from ..data import *
 from ..flags import *
+from ..issues import report
 from ..var import TIEntry
 
 
@@ -282,12 +281,12 @@ class TIComplex(TIEntry):
 
         if data:
             if FloatFlags.ComplexComponent not in self.real_flags:
-                warn("Bits 2 and 3 of the real component flags should be set in a complex entry.",
-                     BytesWarning)
+                report("complex_flags",
+                       "Bits 2 and 3 of the real component flags should be set in a complex entry.", entry=self)
 
             if FloatFlags.ComplexComponent not in self.imag_flags:
-                warn("Bits 2 and 3 of the imaginary component flags should be set in a complex entry.",
-                     BytesWarning)
+                report("complex_flags",
+                       "Bits 2 and 3 of the imaginary component flags should be set in a complex entry.", entry=self)
 
     def __complex__(self):
         return self.complex()
@@ -423,4 +422,151 @@ class TIComplex(TIEntry):
             case _, _: return replacer(f"{self.real} + {self.imag}i", {"+ -": "- ", " 1i": " i"})
 
 
-__all__ = ["TIReal", "TIComplex", "BCD", "FloatFlags"]
+class TIRealView:
+    # A lightweight stand-in for a real number stored within another entry's data section
+    __slots__ = "entry", "offset"
+
+    def __init__(self, entry: TIEntry, offset: int):
+        self.entry = entry
+        self.offset = offset
+
+    def __format__(self, format_spec: str) -> str:
+        match format_spec:
+            case "":
+                return self.string()
+            case "t":
+                return self.string().replace("-", "~")
+            case _:
+                try:
+                    return format(self.decimal(), format_spec)
+
+                except (TypeError, ValueError):
+                    raise TypeError(f"unsupported format string passed to {type(self)}.__format__")
+
+    def __str__(self) -> str:
+        return self.string()
+
+    __float__ = TIReal.__float__
+    __int__ = TIReal.__int__
+
+    def _write(self, start: int, stop: int, value: bytes):
+        value = value[:stop - start].rjust(stop - start, b'\x00')
+        start, stop = self.offset + start, self.offset + stop
+
+        self.entry.raw.splice("data", slice(start, stop), value)
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self.entry.raw.peek("data")[self.offset:self.offset + TIReal.min_data_length])
+
+    @property
+    def flags(self) -> FloatFlags:
+        return FloatFlags.get(self.entry.raw.peek("data")[self.offset:self.offset + 1], self)
+
+    @flags.setter
+    def flags(self, value: FloatFlags):
+        self._write(0, 1, FloatFlags.set(value, self))
+
+    @property
+    def exponent(self) -> int:
+        return self.entry.raw.peek("data")[self.offset + 1]
+
+    @exponent.setter
+    def exponent(self, value: int):
+        self._write(1, 2, Integer.set(value, self))
+
+    @property
+    def mantissa(self) -> int:
+        return BCD.get(self.entry.raw.peek("data")[self.offset + 2:self.offset + 9], self)
+
+    @mantissa.setter
+    def mantissa(self, value: int):
+        self._write(2, 9, BCD.set(value, self))
+
+    is_complex_component = TIReal.is_complex_component
+    is_undefined = TIReal.is_undefined
+    sign = TIReal.sign
+
+    load_decimal = TIReal.load_decimal
+    decimal = TIReal.decimal
+    load_float = TIReal.load_float
+    json_number = TIReal.json_number
+    float = TIReal.float
+    load_int = TIReal.load_int
+    int = TIReal.int
+    load_string = TIReal.load_string
+    string = TIReal.string
+
+
+class TIComplexView:
+    # A lightweight stand-in for a complex number stored within another entry's data section
+    __slots__ = "entry", "offset"
+
+    def __init__(self, entry: TIEntry, offset: int):
+        self.entry = entry
+        self.offset = offset
+
+    def __format__(self, format_spec: str) -> str:
+        match format_spec:
+            case "":
+                return self.string()
+            case "t":
+                return squash(replacer(self.string(), {"i": "[i]", "-": "~", "~ ": "- "}))
+            case _:
+                try:
+                    return format(self.complex(), format_spec)
+
+                except (TypeError, ValueError):
+                    raise TypeError(f"unsupported format string passed to {type(self)}.__format__")
+
+    def __str__(self) -> str:
+        return self.string()
+
+    __complex__ = TIComplex.__complex__
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self.entry.raw.peek("data")[self.offset:self.offset + TIComplex.min_data_length])
+
+    @property
+    def real(self) -> TIRealView:
+        return TIRealView(self.entry, self.offset)
+
+    @real.setter
+    def real(self, value: TIReal | TIRealView):
+        self.real._write(0, TIReal.min_data_length, value.data)
+
+    @property
+    def imag(self) -> TIRealView:
+        return TIRealView(self.entry, self.offset + TIReal.min_data_length)
+
+    @imag.setter
+    def imag(self, value: TIReal | TIRealView):
+        self.imag._write(0, TIReal.min_data_length, value.data)
+
+    @property
+    def real_flags(self) -> FloatFlags:
+        return self.real.flags
+
+    @real_flags.setter
+    def real_flags(self, value: FloatFlags):
+        self.real.flags = value
+
+    @property
+    def imag_flags(self) -> FloatFlags:
+        return self.imag.flags
+
+    @imag_flags.setter
+    def imag_flags(self, value: FloatFlags):
+        self.imag.flags = value
+
+    components = TIComplex.components
+    set_flags = TIComplex.set_flags
+
+    load_complex = TIComplex.load_complex
+    complex = TIComplex.complex
+    load_string = TIComplex.load_string
+    string = TIComplex.string
+
+
+__all__ = ["TIReal", "TIComplex", "TIRealView", "TIComplexView", "BCD", "FloatFlags"]
@@ -1,9 +1,9 @@
 from typing import ByteString, Iterator
-from warnings import warn
 
 from tivars.models import *
 from tivars.tokenizer import TokenizedString
 from ..data import *
+from ..issues import report
 from ..var import SizedEntry
 
 RGB = tuple[int, int, int]
@@ -47,8 +47,8 @@ class RGBPalette(Converter):
     def nearest(cls, r: int, g: int, b: int) -> RGB:
         nearest = min(cls.palette, key=lambda x: (x[0] - r) ** 2 + (x[1] - g) ** 2 + (x[2] - b) ** 2)
         if nearest != (r, g, b):
-            warn(f"The pixel {(r, g, b)} is not contained in the palette; using {nearest} as an approximation.",
-                 UserWarning)
+            report("palette", "The pixel {} is not contained in the palette; using {} as an approximation.",
+                   (r, g, b), nearest, category=UserWarning)
 
         return nearest
 
@@ -142,7 +142,7 @@ class TIMonoPicture(PictureEntry):
     _type_id = b'\x07'
 
     def __iter__(self) -> Iterator[pixel_type]:
-        for byte in self.data[self.data_offset:]:
+        for byte in self.raw.peek("data")[self.data_offset:]:
             for bit in L1.get(byte, self):
                 yield bit
 
@@ -156,11 +156,13 @@ class TIMonoPicture(PictureEntry):
 
     @Loader[list]
     def load_array(self, arr: list[list[pixel_type]]):
-        self.raw.data[2:] = b''.join(L1.set(entry, self) for row in arr for entry in zip(*[iter(row)] * 8, strict=True))
+        self.raw.splice("data", slice(2, None),
+                        b''.join(L1.set(entry, self) for row in arr for entry in zip(*[iter(row)] * 8, strict=True)))
 
     def array(self) -> list[list[pixel_type]]:
+        data = self.raw.peek("data")
         return [[bw for col in range(self.data_width)
-                 for bw in L1.get(self.data[self.data_width * row + col + self.data_offset:][:1], self)]
+                 for bw in L1.get(data[self.data_width * row + col + self.data_offset:][:1], self)]
                 for row in range(self.data_height)]
 
     def coerce(self):
@@ -168,8 +170,7 @@ class TIMonoPicture(PictureEntry):
             case self.min_data_length: pass
             case TIPicture.min_data_length: self.__class__ = TIPicture
             case TIImage.min_data_length: self.__class__ = TIImage
-            case _: warn(f"Picture has unexpected length ({self.length}).",
-                         BytesWarning)
+            case _: report("picture_length", "Picture has unexpected length ({}).", self.length, entry=self)
 
 
 class TIPicture(PictureEntry):
@@ -205,7 +206,7 @@ class TIPicture(PictureEntry):
     pixel_type = RGB
 
     def __iter__(self) -> Iterator[pixel_type]:
-        for byte in self.data[self.data_offset:]:
+        for byte in self.raw.peek("data")[self.data_offset:]:
             for rgb in RGBPalette.get(byte, self):
                 yield rgb
 
@@ -219,11 +220,13 @@ class TIPicture(PictureEntry):
 
     @Loader[list]
     def load_array(self, arr: list[list[pixel_type]]):
-        self.raw.data[2:] = b''.join(RGBPalette.set(entry, self) for row in arr for entry in zip(row[::2], row[1::2]))
+        self.raw.splice("data", slice(2, None),
+                        b''.join(RGBPalette.set(entry, self) for row in arr for entry in zip(row[::2], row[1::2])))
 
     def array(self) -> list[list[pixel_type]]:
+        data = self.raw.peek("data")
         return [[rgb for col in range(self.data_width)
-                 for rgb in RGBPalette.get(self.data[self.data_width * row + col + self.data_offset:][:1], self)]
+                 for rgb in RGBPalette.get(data[self.data_width * row + col + self.data_offset:][:1], self)]
                 for row in range(self.data_height)]
 
     def coerce(self):
@@ -231,8 +234,7 @@ class TIPicture(PictureEntry):
             case self.min_data_length: pass
             case TIMonoPicture.min_data_length: self.__class__ = TIMonoPicture
             case TIImage.min_data_length: self.__class__ = TIImage
-            case _: warn(f"Picture has unexpected length ({self.length}).",
-                         BytesWarning)
+            case _: report("picture_length", "Picture has unexpected length ({}).", self.length, entry=self)
 
 
 # Workaround until the token sheets are updated
@@ -293,7 +295,7 @@ class TIImage(PictureEntry):
     def __iter__(self) -> Iterator[pixel_type]:
         for row in range(self.data_height - 1, -1, -1):
             for col in range(0, self.data_width - 2, 2):
-                yield RGB565.get(self.data[self.data_width * row + col + self.data_offset:][:2], self)
+                yield RGB565.get(self.raw.peek("data")[self.data_width * row + col + self.data_offset:][:2], self)
 
     @Section(8, ImageName)
     def name(self) -> str:
@@ -321,10 +323,12 @@ class TIImage(PictureEntry):
 
     @Loader[list]
     def load_array(self, arr: list[list[pixel_type]]):
-        self.raw.data[3:] = b''.join(RGB565.set(entry, self) for row in arr[::-1] for entry in row + [(0, 0, 0)])
+        self.raw.splice("data", slice(3, None),
+                        b''.join(RGB565.set(entry, self) for row in arr[::-1] for entry in row + [(0, 0, 0)]))
 
     def array(self) -> list[list[pixel_type]]:
-        return [[RGB565.get(self.data[self.data_width * row + col + 3:][:2], self)
+        data = self.raw.peek("data")
+        return [[RGB565.get(data[self.data_width * row + col + 3:][:2], self)
                  for col in range(0, self.data_width - 2, 2)]
                 for row in range(self.data_height)][::-1]
 
@@ -333,8 +337,7 @@ class TIImage(PictureEntry):
             case self.min_data_length: pass
             case TIMonoPicture.min_data_length: self.__class__ = TIMonoPicture
             case TIPicture.min_data_length: self.__class__ = TIPicture
-            case _: warn(f"Image has unexpected length ({self.length}).",
-                         BytesWarning)
+            case _: report("picture_length", "Image has unexpected length ({}).", self.length, entry=self)
 
 
 __all__ = ["TIMonoPicture", "TIPicture", "TIImage",
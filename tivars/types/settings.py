@@ -6,6 +6,7 @@ from warnings import warn
 
 from tivars.models import *
 from ..data import *
+from ..issues import report
 from ..var import TIEntry
 from .numeric import TIReal
 
@@ -21,16 +22,15 @@ class SettingsEntry(TIEntry):
                  data: bytearray = None):
         super().__init__(init, for_flash=for_flash, name=name, version=version, archived=archived, data=data)
 
-        self.raw.data[:len(self.leading_bytes)] = self.leading_bytes
+        self.raw.splice("data", slice(0, len(self.leading_bytes)), self.leading_bytes)
 
     @Loader[ByteString, BytesIO]
     def load_bytes(self, data: bytes | BytesIO):
         super().load_bytes(data)
 
-        if self.data[:len(self.leading_bytes)] != self.leading_bytes:
-            warn(f"The entry has unexpected leading bytes "
-                 f"(expected {self.leading_bytes}, got {self.data[:len(self.leading_bytes)]}).",
-                 BytesWarning)
+        if self.raw.peek("data")[:len(self.leading_bytes)] != self.leading_bytes:
+            report("leading_bytes", "The entry has unexpected leading bytes (expected {}, got {}).",
+                   self.leading_bytes, bytes(self.raw.peek("data")[:len(self.leading_bytes)]), entry=self)
 
     @Loader[dict]
     def load_dict(self, dct: dict):
@@ -7,6 +7,7 @@ from warnings import warn
 from tivars.models import *
 from tivars.tokenizer import *
 from ..data import *
+from ..issues import report
 from ..var import SizedEntry
 
 
@@ -42,11 +43,13 @@ class TokenizedEntry(SizedEntry):
     ]
 
     def derive_version(self) -> bytes:
+        data = bytes(self.raw.peek("data"))
+
         def has_bytes_in(prefix: bytes, start: int, end: int):
-            return any(prefix + bytes([byte]) in self.raw.data for byte in range(start, end + 1))
+            return any(prefix + bytes([byte]) in data for byte in range(start, end + 1))
 
         version = 0x00
-        match self.raw.data:
+        match data:
             case _TI_84PCE if has_bytes_in(b'\xEF', 0x9E, 0xA6):
                 version = 0x0C
 
@@ -74,7 +77,7 @@ class TokenizedEntry(SizedEntry):
             case _TI_83P if has_bytes_in(b'\xBB', 0x68, 0xCE):
                 version = 0x01
 
-        if any(token in self.raw.data for token in self.clock_tokens):
+        if any(token in data for token in self.clock_tokens):
             version += 0x20
 
         return bytes([version])
@@ -92,8 +95,8 @@ class TokenizedEntry(SizedEntry):
         super().load_bytes(data)
 
         if self.raw.version != (version := self.derive_version()):
-            warn(f"The version is incorrect (expected {version}, got {self.raw.version}).",
-                 BytesWarning)
+            report("version", "The version is incorrect (expected {}, got {}).", version, self.raw.version,
+                   entry=self, offset=13)
 
     def load_data_section(self, data: BytesIO):
         data_length = int.from_bytes(length_bytes := data.read(2), 'little')
@@ -101,12 +104,12 @@ class TokenizedEntry(SizedEntry):
 
     @Loader[str]
     def load_string(self, string: str, *, model: TIModel = None):
-        self.raw.data[2:] = self.encode(string, model=model)
-        self.length = len(self.raw.data[2:])
+        self.raw.splice("data", slice(2, None), self.encode(string, model=model))
+        self.length = len(self.raw.peek("data")[2:])
         self.raw.version = self.derive_version()
 
     def string(self) -> str:
-        return self.decode(self.data[2:])
+        return self.decode(self.raw.peek("data")[2:])
 
 
 class EquationName(TokenizedString):
@@ -0,0 +1,111 @@
+import zlib
+
+from collections import namedtuple
+from io import BytesIO
+from typing import ByteString
+
+from tivars.models import *
+from .var import TIEntry, buffer
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+
+MAGICS = {model.magic.encode() for model in MODELS}
+
+# Every type ID the calculators use, from reals (0x00) through certificate memory (0x27)
+# Most have no entry type here, but are no less valid for that
+TYPE_IDS = {bytes([type_id]) for type_id in range(0x28)}
+
+ValidationIssue = namedtuple("ValidationIssue", ["code", "entry", "offset", "message"])
+
+
+class ValidationReport(namedtuple("ValidationReport", ["issues", "entry_count", "checksum"])):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    @property
+    def codes(self) -> set[str]:
+        return {issue.code for issue in self.issues}
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+
+def byte_sum(data: memoryview) -> int:
+    if np is not None:
+        return int(np.frombuffer(data, dtype=np.uint8).sum(dtype=np.uint64))
+
+    # The low half of an Adler-32 is one more than the byte sum, exactly so for chunks of at most 256 bytes
+    return sum((zlib.adler32(data[i:i + 256]) & 0xFFFF) - 1 for i in range(0, len(data), 256))
+
+
+def validate(data: ByteString | BytesIO) -> ValidationReport:
+    # Only lengths and a handful of bytes are inspected; no entries are built and nothing is warned
+    data = buffer(data)
+    issues = []
+
+    if len(data) < 57:
+        issues.append(ValidationIssue("truncated", None, 0,
+                                      f"The var is too short to contain a header and checksum ({len(data)} bytes)."))
+        return ValidationReport(issues, 0, None)
+
+    if bytes(data[:8]) not in MAGICS:
+        issues.append(ValidationIssue("magic", None, 0, f"The file magic ({bytes(data[:8])}) is not recognized."))
+
+    end = len(data) - 2
+    if (entry_length := int.from_bytes(data[53:55], 'little')) != end - 55:
+        issues.append(ValidationIssue("entry_length", None, 53,
+                                      f"The header entry length ({entry_length}) does not match "
+                                      f"the file size ({end - 55})."))
+
+    # Walk the entries by their lengths
+    count, offset = 0, 55
+    while offset < end:
+        if offset + 4 > end:
+            issues.append(ValidationIssue("entry_truncated", count, offset, "The entry lengths are cut off."))
+            break
+
+        meta_length = int.from_bytes(data[offset:offset + 2], 'little')
+        data_length = data[offset + 2:offset + 4]
+
+        if meta_length not in (TIEntry.base_meta_length, TIEntry.flash_meta_length):
+            issues.append(ValidationIssue("meta_length", count, offset,
+                                          f"The entry meta length has an unexpected value ({meta_length})."))
+
+        if offset + 4 + meta_length > end:
+            issues.append(ValidationIssue("entry_truncated", count, offset, "The entry meta is cut off."))
+            break
+
+        if (type_id := bytes(data[offset + 4:offset + 5])) not in TYPE_IDS:
+            issues.append(ValidationIssue("type_id", count, offset + 4,
+                                          f"Type ID 0x{type_id.hex()} is not recognized."))
+
+        data_length2 = data[offset + 2 + meta_length:offset + 4 + meta_length]
+        if data_length != data_length2:
+            issues.append(ValidationIssue("data_length", count, offset + 2 + meta_length,
+                                          f"The entry data lengths are mismatched "
+                                          f"({bytes(data_length)} vs. {bytes(data_length2)})."))
+
+        count += 1
+        offset += 4 + meta_length + int.from_bytes(data_length2, 'little')
+
+        if offset > end:
+            issues.append(ValidationIssue("entry_truncated", count - 1, offset, "The entry data is cut off."))
+
+    # Check² sum
+    checksum = int.to_bytes(byte_sum(data[55:end]) & 0xFFFF, 2, 'little')
+    if (expected := bytes(data[end:])) != checksum:
+        issues.append(ValidationIssue("checksum", None, end,
+                                      f"The checksum is incorrect (expected {checksum}, got {expected})."))
+
+    return ValidationReport(issues, count, checksum)
+
+
+__all__ = ["validate", "ValidationIssue", "ValidationReport"]
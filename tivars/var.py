@@ -1,10 +1,47 @@
+import hashlib
+import mmap
+import os
+import pickle
+
+from collections import namedtuple
+from contextlib import contextmanager
+from copy import copy
 from io import BytesIO
-from typing import BinaryIO, ByteString, Iterator
+from typing import AsyncIterator, BinaryIO, ByteString, Callable, Generator, Iterator
 from warnings import warn
 
 from tivars.models import *
 from tivars.tokenizer import TokenizedString
+from . import aio
 from .data import *
+from .issues import report
+
+
+def buffer(data: ByteString | BytesIO) -> memoryview:
+    # Any buffer (bytes, bytearray, mmap, shared memory) is viewed in place; streams are read out
+    try:
+        return memoryview(data)
+
+    except TypeError:
+        return memoryview(data.read())
+
+
+def reader(source: BinaryIO | ByteString) -> Callable[[int, int], ByteString]:
+    # Reads from any buffer in place, or seeks through a stream so that skipped bytes are never read
+    try:
+        view = memoryview(source)
+
+        def read(offset: int, length: int) -> ByteString:
+            return view[offset:offset + length]
+
+    except TypeError:
+        start = source.tell()
+
+        def read(offset: int, length: int) -> ByteString:
+            source.seek(start + offset)
+            return source.read(length)
+
+    return read
 
 
 class TIHeader:
@@ -14,6 +51,11 @@ class TIHeader:
         def bytes(self) -> bytes:
             return self.magic + self.extra + self.product_id + self.comment
 
+        def copy(self) -> 'TIHeader.Raw':
+            new = self.__class__()
+            new.magic, new.extra, new.product_id, new.comment = self.magic, self.extra, self.product_id, self.comment
+            return new
+
     def __init__(self, model: TIModel = None, *,
                  magic: str = None, extra: bytes = b'\x1a\x0a', product_id: bytes = b'\x00',
                  comment: str = "Created with tivars_lib_py v0.6"):
@@ -30,10 +72,14 @@ class TIHeader:
         return self.bytes()
 
     def __copy__(self) -> 'TIHeader':
-        new = TIHeader()
-        new.load_bytes(self.bytes())
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.raw = self.raw.copy()
         return new
 
+    def __reduce_ex__(self, protocol: int):
+        return self._unpickle, (self.bytes(),)
+
     def __eq__(self, other: 'TIHeader') -> bool:
         try:
             return self.__class__ == other.__class__ and self.bytes() == other.bytes()
@@ -100,35 +146,36 @@ class TIHeader:
                     model = max(models, key=lambda m: m.flags)
 
                 except ValueError:
-                    warn(f"The var product ID ({self.product_id}) is not recognized.",
-                         BytesWarning)
+                    report("product_id", "The var product ID ({}) is not recognized.", self.product_id, offset=10)
                     model = None
 
             case _:
-                warn(f"The var file magic ({self.magic}) is not recognized.",
-                     BytesWarning)
+                report("magic", "The var file magic ({}) is not recognized.", self.magic, offset=0)
                 model = None
 
         return model
 
-    def load_bytes(self, data: bytes | BytesIO):
-        try:
-            data = BytesIO(data.read())
+    @classmethod
+    def _unpickle(cls, data: bytes) -> 'TIHeader':
+        header = cls.__new__(cls)
+        header.raw = cls.Raw()
+        header.load_bytes(data)
+        return header
 
-        except AttributeError:
-            data = BytesIO(data)
+    def load_bytes(self, data: ByteString | BytesIO):
+        data = buffer(data)
 
         # Read magic
-        self.raw.magic = data.read(8)
+        self.raw.magic = bytes(data[0:8])
 
         # Read export bytes
-        self.raw.extra = data.read(2)
+        self.raw.extra = bytes(data[8:10])
 
         # Read product ID
-        self.raw.product_id = data.read(1)
+        self.raw.product_id = bytes(data[10:11])
 
         # Read comment
-        self.raw.comment = data.read(42)
+        self.raw.comment = bytes(data[11:53])
 
     def bytes(self) -> bytes:
         return self.raw.bytes()
@@ -158,16 +205,125 @@ class TIEntry(Dock, Converter):
     _type_id = None
 
     class Raw:
-        __slots__ = "meta_length", "type_id", "name", "version", "archived", "data"
+        __slots__ = "meta_length", "type_id", "name", "version", "archived", \
+            "_data", "_data_sum", "_digest", "_shared", "_exposed"
+
+        def __init__(self):
+            self._data_sum = None
+            self._digest = None
+            self._shared = False
+            self._exposed = False
 
         def bytes(self) -> bytes:
-            return self.meta_length + self.data_length + \
-                self.type_id + self.name + self.version + self.archived + \
-                self.data_length + self.data
+            return b''.join(self.parts())
+
+        def copy(self) -> 'TIEntry.Raw':
+            # Both copies share the data section until either is written to, which then takes its own copy
+            new = self.__class__()
+            for cls in self.__class__.__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(self, name):
+                        setattr(new, name, getattr(self, name))
+
+            if self._exposed:
+                # The data section is being edited, so it may yet be written to behind our back
+                new.data = bytearray(self._data)
+
+            else:
+                self._shared = new._shared = True
+
+            return new
+
+        def extras(self) -> dict[str, bytes]:
+            # Fields added by subclasses, e.g. the flags of a graphed equation
+            return {name: getattr(self, name) for cls in type(self).__mro__
+                    if issubclass(cls, TIEntry.Raw) and cls is not TIEntry.Raw
+                    for name in cls.__slots__ if hasattr(self, name)}
+
+        def parts(self) -> list[ByteString]:
+            data_length = self.data_length
+            return [self.meta_length, data_length,
+                    self.type_id, self.name, self.version, self.archived,
+                    data_length, self._data]
+
+        def peek(self, name: str) -> ByteString:
+            # For reads only; the data section may be shared
+            return self._data if name == "data" else getattr(self, name)
+
+        @contextmanager
+        def edit(self) -> Iterator[bytearray]:
+            # The running sum and digest are distrusted while the buffer is out, then reset once it is returned
+            self.unshare()
+            self._exposed = True
+
+            try:
+                yield self._data
+
+            finally:
+                self.data = self._data
+
+        def splice(self, name: str, indices: slice, value: ByteString):
+            self.unshare()
+
+            if self._data_sum is not None:
+                self._data_sum += sum(value) - sum(self._data[indices])
+
+            self._digest = None
+            self._data[indices] = value
+
+        def modified(self, name: str):
+            # Sections report their writes here, so the digest is only cleared when the entry changes
+            self._digest = None
+
+        def unshare(self):
+            # Views of other buffers (e.g. mapped files) are read-only, so they are copied too
+            if self._shared or not isinstance(self._data, bytearray):
+                self._data = bytearray(self._data)
+                self._shared = False
+
+        @property
+        def checksum(self) -> int:
+            return sum(self.meta_length + self.type_id + self.name + self.version + self.archived) + \
+                2 * sum(self.data_length) + self.data_sum
+
+        @property
+        def data(self) -> bytes:
+            # A snapshot, so reading never copies a shared buffer nor lets writes bypass the running sum
+            return bytes(self._data)
+
+        @data.setter
+        def data(self, value: bytearray):
+            self._data = value
+            self._data_sum = None
+            self._digest = None
+            self._shared = False
+            self._exposed = False
 
         @property
         def data_length(self) -> bytes:
-            return int.to_bytes(len(self.data), 2, 'little')
+            return int.to_bytes(len(self._data), 2, 'little')
+
+        @property
+        def digest(self) -> bytes:
+            # Like the running sum, the digest can't be trusted while the data section is being edited
+            if self._digest is None or self._exposed:
+                digest = hashlib.sha256()
+                for part in self.parts():
+                    digest.update(part)
+
+                self._digest = digest.digest()
+
+            return self._digest
+
+        @property
+        def data_sum(self) -> int:
+            if self._exposed:
+                return sum(self._data)
+
+            if self._data_sum is None:
+                self._data_sum = sum(self._data)
+
+            return self._data_sum
 
         @property
         def flash_bytes(self) -> bytes:
@@ -176,7 +332,7 @@ class TIEntry(Dock, Converter):
 
         @property
         def meta(self) -> bytes:
-            return self.bytes()[2:int.from_bytes(self.meta_length, 'little') + 2]
+            return b''.join(self.parts()[1:6])[:int.from_bytes(self.meta_length, 'little')]
 
     def __init__(self, init=None, *,
                  for_flash: bool = True, name: str = "UNNAMED",
@@ -201,7 +357,7 @@ class TIEntry(Dock, Converter):
 
         self.clear()
         if data:
-            self.data[:len(data)] = bytearray(data)
+            self.raw.splice("data", slice(0, len(data)), bytearray(data))
         elif init is not None:
             try:
                 self.load_bytes(init.bytes())
@@ -215,13 +371,14 @@ class TIEntry(Dock, Converter):
         return self.bytes()
 
     def __copy__(self) -> 'TIEntry':
-        new = self.__class__()
-        new.load_bytes(self.bytes())
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.raw = self.raw.copy()
         return new
 
     def __eq__(self, other: 'TIEntry') -> bool:
         try:
-            return self.__class__ == other.__class__ and self.bytes() == other.bytes()
+            return self.__class__ == other.__class__ and self.digest == other.digest
 
         except AttributeError:
             return False
@@ -229,12 +386,27 @@ class TIEntry(Dock, Converter):
     def __format__(self, format_spec: str) -> str:
         raise TypeError(f"unsupported format string passed to {type(self)}.__format__")
 
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
     def __iter__(self) -> Iterator:
         raise NotImplementedError
 
     def __len__(self) -> int:
         return 2 + self.meta_length + 2 + self.data_length
 
+    def __reduce_ex__(self, protocol: int):
+        # Entries pickle as just their class, meta, data, and any extra raw fields
+        if protocol >= 5:
+            # Protocol 5 can pass the data out-of-band, in which case the unpickled entry may share it
+            data = pickle.PickleBuffer(self.raw.peek("data"))
+            self.raw._shared = True
+
+        else:
+            data = bytes(self.raw.peek("data"))
+
+        return self._unpickle, (self.raw.meta, data, self.raw.extras())
+
     def __str__(self) -> str:
         return self.string()
 
@@ -254,7 +426,7 @@ class TIEntry(Dock, Converter):
         Can be zero
         """
 
-        return len(self.data)
+        return len(self.raw.peek("data"))
 
     @Section(1, Bytes)
     def type_id(self) -> bytes:
@@ -313,6 +485,26 @@ class TIEntry(Dock, Converter):
     def is_empty(self) -> bool:
         return self.data_length == 0
 
+    @property
+    def checksum(self) -> int:
+        """
+        The sum of all bytes in the entry
+
+        Changes made through sections are tracked incrementally, so the data section is only summed once
+        """
+
+        return self.raw.checksum
+
+    @property
+    def digest(self) -> bytes:
+        """
+        The SHA-256 digest of the entry
+
+        The digest is cached until the entry is next written to
+        """
+
+        return self.raw.digest
+
     @property
     def meta(self) -> bytes:
         return self.raw.data_length + self.raw.type_id + self.raw.name + self.raw.version + self.raw.archived
@@ -325,6 +517,37 @@ class TIEntry(Dock, Converter):
 
         return 2 + meta_length + 2 + data_length
 
+    @classmethod
+    def from_raw(cls, meta: ByteString, data: ByteString) -> 'TIEntry':
+        entry = cls._from_raw(meta, data)
+
+        try:
+            entry.coerce()
+
+        except TypeError:
+            report("type_id", "Type ID 0x{} is not recognized; entry will not be coerced to a subclass.",
+                   entry.raw.type_id.hex(), entry=entry, offset=4)
+
+        return entry
+
+    @classmethod
+    def _from_raw(cls, meta: ByteString, data: ByteString) -> 'TIEntry':
+        entry = cls.__new__(cls)
+        entry.raw = entry.Raw()
+        entry._load_raw(meta, data)
+
+        return entry
+
+    @classmethod
+    def _unpickle(cls, meta: bytes, data: ByteString, extras: dict[str, bytes] = None) -> 'TIEntry':
+        # Out-of-band buffers are viewed rather than copied until the entry is written to
+        entry = cls._from_raw(meta, data if isinstance(data, bytearray) else memoryview(data))
+
+        for name, value in (extras or {}).items():
+            setattr(entry.raw, name, value)
+
+        return entry
+
     @classmethod
     def register(cls, var_type: type['TIEntry']):
         cls.type_ids[var_type._type_id] = var_type
@@ -342,7 +565,7 @@ class TIEntry(Dock, Converter):
     def set_length(self, length: int = None):
         length = length or self.min_data_length
         if length > self.data_length:
-            self.raw.data.extend(bytearray(length - self.data_length))
+            self.raw.splice("data", slice(self.data_length, None), bytearray(length - self.data_length))
 
     def unarchive(self):
         if self.flash_bytes:
@@ -350,93 +573,145 @@ class TIEntry(Dock, Converter):
         else:
             raise TypeError("entry does not support archiving.")
 
-    @Loader[ByteString, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        try:
-            data = BytesIO(data.read())
+    def edit(self) -> Iterator[bytearray]:
+        """
+        Lends out the data section for writing in place
 
-        except AttributeError:
-            data = BytesIO(data)
+        The checksum and digest are recomputed once the block exits; the buffer should not be kept past it
+        """
+
+        return self.raw.edit()
+
+    def unshare(self):
+        """
+        Gives the entry its own copy of its data section
+
+        Data sections which are shared with a copy of the entry or view another buffer (e.g. a mapped file) are copied
+        """
+
+        self.raw.unshare()
+
+    @Loader[ByteString, BytesIO]
+    def load_bytes(self, data: ByteString | BytesIO):
+        data = buffer(data)
 
         # Read meta length
-        self.raw.meta_length = data.read(2)
+        self.raw.meta_length = bytes(data[0:2])
 
         # Read data length
-        data_length = data.read(2)
+        data_length = bytes(data[2:4])
 
         # Read and check type ID
-        self.raw.type_id = data.read(1)
+        self.raw.type_id = bytes(data[4:5])
 
         if self._type_id is not None and self.raw.type_id != self._type_id:
             if self.raw.type_id in TIEntry.type_ids:
-                warn(f"The entry type is incorrect (expected {type(self)}, got {TIEntry.type_ids[self.raw.type_id]}).",
-                     BytesWarning)
+                report("type_id", "The entry type is incorrect (expected {}, got {}).",
+                       type(self), TIEntry.type_ids[self.raw.type_id], entry=self, offset=4)
 
             else:
-                warn(f"The entry type is incorrect (expected {type(self)}, got an unknown type). "
-                     f"Load the var file into a TIVar instance if you don't know the entry type(s).",
-                     BytesWarning)
+                report("type_id", "The entry type is incorrect (expected {}, got an unknown type). "
+                       "Load the var file into a TIVar instance if you don't know the entry type(s).",
+                       type(self), entry=self, offset=4)
 
         # Read varname
-        self.raw.name = data.read(8)
+        self.raw.name = bytes(data[5:13])
+        offset = 13
 
         # Read flash bytes
         match self.meta_length:
             case TIEntry.flash_meta_length:
-                self.raw.version = data.read(1)
-                self.raw.archived = data.read(1)
+                self.raw.version = bytes(data[13:14])
+                self.raw.archived = bytes(data[14:15])
+                offset = 15
 
                 if self.versions and self.raw.version not in self.versions:
-                    warn(f"The version ({self.raw.version.hex()}) is not recognized.",
-                         BytesWarning)
+                    report("version", "The version ({}) is not recognized.", self.raw.version.hex(),
+                           entry=self, offset=13)
 
                 if self.raw.archived not in b'\x00\x80':
-                    warn(f"The archive flag ({self.raw.archived.hex()}) is set to an unexpected value.",
-                         BytesWarning)
+                    report("archived", "The archive flag ({}) is set to an unexpected value.", self.raw.archived.hex(),
+                           entry=self, offset=14)
 
             case TIEntry.base_meta_length:
                 self.raw.version = b'\x00'
                 self.raw.archived = b'\x00'
 
                 if self.flash_only:
-                    warn(f"{type(self)} vars are not compatible with flashless chips.",
-                         BytesWarning)
+                    report("flash_only", "{} vars are not compatible with flashless chips.", type(self),
+                           entry=self, offset=0)
 
             case _:
-                warn(f"The entry meta length has an unexpected value ({self.meta_length}); "
-                     f"attempting to read flash bytes anyway.",
-                     BytesWarning)
-                self.raw.version = data.read(1)
-                self.raw.archived = data.read(1)
+                report("meta_length", "The entry meta length has an unexpected value ({}); "
+                       "attempting to read flash bytes anyway.", self.meta_length, entry=self, offset=0)
+                self.raw.version = bytes(data[13:14])
+                self.raw.archived = bytes(data[14:15])
+                offset = 15
 
                 if self.raw.archived not in b'\x00\x80':
-                    warn(f"The archive flag is set to an unexpected value.",
-                         BytesWarning)
+                    report("archived", "The archive flag is set to an unexpected value.", entry=self, offset=14)
 
         # Read data and check length
-        data_length2 = data.read(2)
+        data_length2 = bytes(data[offset:offset + 2])
         if data_length != data_length2:
-            warn(f"The var entry data lengths are mismatched ({data_length} vs. {data_length2}); "
-                 f"using {data_length2} to read the data section.",
-                 BytesWarning)
+            report("data_length", "The var entry data lengths are mismatched ({} vs. {}); "
+                   "using {} to read the data section.", data_length, data_length2, data_length2,
+                   entry=self, offset=offset)
 
-        self.raw.data = bytearray(data.read(int.from_bytes(data_length2, 'little')))
+        offset += 2
+        self.raw.data = bytearray(data[offset:offset + int.from_bytes(data_length2, 'little')])
 
         try:
             self.coerce()
 
         except TypeError:
-            warn(f"Type ID 0x{self.raw.type_id.hex()} is not recognized; entry will not be coerced to a subclass.",
-                 BytesWarning)
+            report("type_id", "Type ID 0x{} is not recognized; entry will not be coerced to a subclass.",
+                   self.raw.type_id.hex(), entry=self, offset=4)
 
     def bytes(self) -> bytes:
         return self.raw.bytes()
 
+    def load_view(self, view: memoryview):
+        # Only the meta is copied; the data section stays a view until written
+        meta_length = int.from_bytes(view[0:2], 'little')
+        data_length = int.from_bytes(view[2 + meta_length:4 + meta_length], 'little')
+
+        self._load_raw(view[2:2 + meta_length], view[4 + meta_length:4 + meta_length + data_length])
+
+        try:
+            self.coerce()
+
+        except TypeError:
+            report("type_id", "Type ID 0x{} is not recognized; entry will not be coerced to a subclass.",
+                   self.raw.type_id.hex(), entry=self, offset=4)
+
+    def _load_raw(self, meta: ByteString, data: ByteString):
+        # The raw fields are filled directly, skipping the section setters (and tokenizing the name)
+        self.raw.meta_length = int.to_bytes(len(meta), 2, 'little')
+        self.raw.type_id = bytes(meta[2:3])
+        self.raw.name = bytes(meta[3:11])
+
+        if len(meta) > TIEntry.base_meta_length:
+            self.raw.version = bytes(meta[11:12])
+            self.raw.archived = bytes(meta[12:13])
+
+        else:
+            self.raw.version = b'\x00'
+            self.raw.archived = b'\x00'
+
+        self.raw.data = data.toreadonly() if isinstance(data, memoryview) else bytearray(data)
+
     def load_data_section(self, data: BytesIO):
         self.raw.data = bytearray(data.read(type(self).data.length))
 
     @Loader[BinaryIO]
-    def load_from_file(self, file: BinaryIO, *, offset: int = 0):
+    def load_from_file(self, file: BinaryIO, *, offset: int = 0, index: 'TIVarIndex' = None):
+        if index is not None:
+            record = index[offset]
+            file.seek(record.offset)
+            self.load_bytes(file.read(record.length))
+            return
+
         # Load header
         header = TIHeader()
         header.load_from_file(file)
@@ -458,20 +733,33 @@ class TIEntry(Dock, Converter):
         raise NotImplementedError
 
     def open(self, filename: str):
+        self._check_extension(filename)
+
+        with open(filename, 'rb') as file:
+            self._load_first(file)
+
+    async def aopen(self, filename: str):
+        self._check_extension(filename)
+
+        async with aio.limited():
+            data = await aio.read_file(filename)
+            await aio.run(self._load_first, BytesIO(data))
+
+    def _check_extension(self, filename: str):
         if self._type_id is not None and \
                 not any(filename.endswith(extension) for extension in self.extensions.values()):
             warn(f"File extension .{filename.split('.')[-1]} not recognized for var type {type(self)}; "
                  f"attempting to read anyway.")
 
-        with open(filename, 'rb') as file:
-            file.seek(55)
-            self.load_bytes(file.read(self.next_entry_length(file)))
-            file.seek(2, 1)
+    def _load_first(self, file: BinaryIO):
+        file.seek(55)
+        self.load_bytes(file.read(self.next_entry_length(file)))
+        file.seek(2, 1)
 
-            if file.read():
-                warn("The selected var file contains multiple entries; only the first will be loaded. "
-                     "Use load_from_file to select a particular entry, or load the entire file in a TIVar object.",
-                     UserWarning)
+        if file.read():
+            warn("The selected var file contains multiple entries; only the first will be loaded. "
+                 "Use load_from_file to select a particular entry, or load the entire file in a TIVar object.",
+                 UserWarning)
 
     def save(self, filename: str = None, *, header: TIHeader = None, model: TIModel = None):
         self.export(header=header, model=model).save(filename)
@@ -497,7 +785,13 @@ class TIVar:
         super().__init__()
 
         self.header = header or TIHeader(magic=model.magic if model is not None else None)
-        self.entries = []
+        self._index = TIVarIndex()
+
+        self._entries = []
+        self._view = None
+
+        self._mapping = None
+        self._mapped = None
 
         self.name = name
         self._model = model
@@ -513,10 +807,23 @@ class TIVar:
         return self.bytes()
 
     def __copy__(self) -> 'TIVar':
-        new = TIVar()
-        new.load_bytes(self.bytes())
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+
+        new.header = copy(self.header)
+        new._index = TIVarIndex(self._index.records)
+        new._entries = [copy(entry) if entry is not None else None for entry in self._entries]
+
+        # Only the original closes the mapped file
+        new._mapping = new._mapped = None
         return new
 
+    def __enter__(self) -> 'TIVar':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def __eq__(self, other: 'TIVar'):
         try:
             eq = self.__class__ == other.__class__ and len(self.entries) == len(other.entries)
@@ -525,9 +832,32 @@ class TIVar:
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
     def __len__(self):
         return len(self.header) + self.entry_length + 2
 
+    def __reduce_ex__(self, protocol: int):
+        # Models are pickled by name, since they are compared by identity
+        return self._unpickle, (self.header, self.name, self._model.name if self._model else None, self.entries)
+
+    @property
+    def entries(self) -> list[TIEntry]:
+        """
+        The entries of the var
+
+        Entries indexed by load_view or open_lazy are built on first access
+        """
+
+        if self._view is not None:
+            for i in range(len(self._entries)):
+                self.entry_at(i)
+
+            self._view = None
+
+        return self._entries
+
     @property
     def entry_length(self) -> int:
         """
@@ -546,7 +876,17 @@ class TIVar:
         This is equal to the lower 2 bytes of the sum of all bytes in the entries
         """
 
-        return int.to_bytes(sum(sum(entry.bytes()) for entry in self.entries) & 0xFFFF, 2, 'little')
+        return int.to_bytes(sum(entry.checksum for entry in self.entries) & 0xFFFF, 2, 'little')
+
+    @property
+    def digest(self) -> bytes:
+        """
+        The SHA-256 digest of the var's entries
+
+        Like equality, this ignores the header; it is built from the cached digest of each entry
+        """
+
+        return hashlib.sha256(b''.join(entry.digest for entry in self.entries)).digest()
 
     @property
     def extension(self) -> str:
@@ -565,14 +905,50 @@ class TIVar:
         else:
             return "8xg"
 
+    @property
+    def index(self) -> 'TIVarIndex':
+        """
+        The index of the var's entries, as they would be saved
+
+        Entries not yet built by load_view or open_lazy are indexed without building them
+        """
+
+        records, offset = [], 55
+        for i, entry in enumerate(self._entries):
+            if entry is None:
+                records.append(self._index[i]._replace(offset=offset))
+
+            else:
+                records.append(TIVarIndex.Record(offset, entry.meta_length, entry.raw.type_id, entry.data_length))
+
+            offset += records[-1].length
+
+        return TIVarIndex(records)
+
     @property
     def is_empty(self) -> bool:
-        return len(self.entries) == 0
+        return len(self._entries) == 0
 
     @property
     def model(self) -> TIModel:
         return self.model
 
+    @classmethod
+    def _unpickle(cls, header: TIHeader, name: str, model: str | None, entries: list[TIEntry]) -> 'TIVar':
+        var = cls.__new__(cls)
+        var.header = header
+        var._index = TIVarIndex()
+
+        var._entries = entries
+        var._view = None
+
+        var._mapping = None
+        var._mapped = None
+
+        var.name = name
+        var._model = next((m for m in MODELS if m.name == model), None)
+        return var
+
     def add_entry(self, entry: TIEntry = None):
         entry = entry or TIEntry()
 
@@ -585,30 +961,63 @@ class TIVar:
         self.entries.append(entry)
 
     def clear(self):
-        self.entries.clear()
+        self._index = TIVarIndex()
 
-    def load_bytes(self, data: bytes | BytesIO):
-        try:
-            data = BytesIO(data.read())
+        self._entries = []
+        self._view = None
 
-        except AttributeError:
-            data = BytesIO(data)
+    def close(self):
+        """
+        Releases the file mapped by open_lazy
+
+        Entries still viewing the file are built and given their own copies of their data first
+        """
+
+        if self._mapping is not None:
+            for entry in self.entries:
+                entry.unshare()
+
+            mapping, self._mapping, self._mapped = self._mapping, None, None
+
+            try:
+                mapping.close()
+
+            except BufferError:
+                # Copies of the var or its entries still view the file, so it is unmapped once they are gone
+                pass
+
+    def entry_at(self, index: int) -> TIEntry:
+        if self._entries[index] is None:
+            record = self._index[index]
+
+            self._entries[index] = TIEntry()
+            self._entries[index].load_view(self._view[record.offset:record.offset + record.length])
+
+        return self._entries[index]
+
+    def load_bytes(self, data: ByteString | BytesIO):
+        data = buffer(data)
 
         # Read header
-        self.header.load_bytes(data.read(53))
-        entry_length = int.from_bytes(data.read(2), 'little')
+        self.header.load_bytes(data[:53])
+        entry_length = int.from_bytes(data[53:55], 'little')
 
         # Read entries
-        while entry_length:
+        offset = 55
+        while entry_length > 0:
             self.add_entry()
 
-            length = TIEntry.next_entry_length(data)
-            self.entries[-1].load_bytes(data.read(length))
+            meta_length = int.from_bytes(data[offset:offset + 2], 'little')
+            data_length = int.from_bytes(data[offset + 2:offset + 4], 'little')
+            length = 2 + meta_length + 2 + data_length
 
+            self.entries[-1].load_bytes(data[offset:offset + length])
+
+            offset += length
             entry_length -= length
 
         # Read checksum
-        checksum = data.read(2)
+        checksum = bytes(data[offset:offset + 2])
 
         # Discern model
         model = self.header.derive_model()
@@ -617,33 +1026,84 @@ class TIVar:
             self._model = model
 
         elif self._model != model:
-            warn(f"The var file comes from a different model (expected {self._model}, got {model}).")
+            report("model", "The var file comes from a different model (expected {}, got {}).", self._model, model,
+                   category=UserWarning)
 
         # Check² sum
-        if checksum != self.checksum:
-            warn(f"The checksum is incorrect (expected {self.checksum}, got {checksum}).",
-                 BytesWarning)
+        if checksum != (expected := self.checksum):
+            report("checksum", "The checksum is incorrect (expected {}, got {}).", expected, checksum, offset=offset)
+
+    def load_view(self, view: memoryview):
+        # Read header
+        self.header.load_bytes(view[:53])
+
+        # Index entries without building them
+        self.clear()
+        self._index.load_var_bytes(view)
+
+        self._entries = [None] * len(self._index)
+        self._view = view
+
+        if self._model is None:
+            self._model = self.header.derive_model()
 
     def bytes(self):
-        dump = self.header.bytes()
-        dump += int.to_bytes(self.entry_length, 2, 'little')
+        return b''.join(self.parts())
+
+    def parts(self) -> list[ByteString]:
+        parts = [self.header.bytes(), int.to_bytes(self.entry_length, 2, 'little')]
 
         for entry in self.entries:
-            dump += entry.bytes()
+            parts += entry.raw.parts()
 
-        dump += self.checksum
-        return dump
+        parts.append(self.checksum)
+        return parts
 
     def load_var_file(self, file: BinaryIO):
         self.load_bytes(file.read())
 
+    def write_var_file(self, file: BinaryIO):
+        file.writelines(self.parts())
+
     def open(self, filename: str):
         with open(filename, 'rb') as file:
             self.load_bytes(file.read())
 
+    async def aopen(self, filename: str):
+        async with aio.limited():
+            data = await aio.read_file(filename)
+            await aio.run(self.load_bytes, data)
+
+    def open_lazy(self, filename: str):
+        self.close()
+
+        with open(filename, 'rb') as file:
+            # Empty files can't be mapped, but there is nothing in them to view anyway
+            if os.fstat(file.fileno()).st_size:
+                self._mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mapped = filename
+
+        self.load_view(memoryview(self._mapping if self._mapping is not None else b''))
+
+    def _release(self, filename: str):
+        # Saving over the mapped file truncates it under any entries still viewing it
+        if self._mapped is not None and os.path.exists(filename) and os.path.samefile(filename, self._mapped):
+            self.close()
+
     def save(self, filename: str = None):
-        with open(filename or f"{self.name}.{self.extension}", 'wb+') as file:
-            file.write(self.bytes())
+        filename = filename or f"{self.name}.{self.extension}"
+        self._release(filename)
+
+        with open(filename, 'wb+') as file:
+            self.write_var_file(file)
+
+    async def asave(self, filename: str = None):
+        filename = filename or f"{self.name}.{self.extension}"
+        self._release(filename)
+
+        async with aio.limited():
+            parts = await aio.run(self.parts)
+            await aio.write_file(filename, parts)
 
 
 class SizedEntry(TIEntry):
@@ -664,9 +1124,216 @@ class SizedEntry(TIEntry):
     def load_bytes(self, data: ByteString):
         super().load_bytes(data)
 
-        if self.length != len(self.data[2:]):
-            warn(f"The entry has an unexpected data length (expected {self.length}, got {len(self.data[2:])}).",
-                 BytesWarning)
+        if self.length != len(self.raw.peek("data")[2:]):
+            report("data_length", "The entry has an unexpected data length (expected {}, got {}).",
+                   self.length, len(self.raw.peek("data")[2:]), entry=self)
+
+
+class TIVarIndex:
+    class Record(namedtuple("Record", ["offset", "meta_length", "type_id", "data_length"])):
+        __slots__ = ()
+
+        @property
+        def length(self) -> int:
+            return 2 + self.meta_length + 2 + self.data_length
+
+    magic = b'TIVI'
+
+    def __init__(self, records: list[Record] = None):
+        self.records = records or []
+
+    def __bytes__(self) -> bytes:
+        return self.bytes()
+
+    def __eq__(self, other: 'TIVarIndex') -> bool:
+        try:
+            return self.__class__ == other.__class__ and self.records == other.records
+
+        except AttributeError:
+            return False
+
+    def __getitem__(self, index: int) -> Record:
+        return self.records[index]
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def load_var_bytes(self, data: ByteString | BytesIO):
+        data = buffer(data)
+
+        self.records = []
+        offset, end = 55, 55 + int.from_bytes(data[53:55], 'little')
+        while offset < min(end, len(data)):
+            meta_length = int.from_bytes(data[offset:offset + 2], 'little')
+            data_length = int.from_bytes(data[offset + 2:offset + 4], 'little')
+
+            self.records.append(self.Record(offset, meta_length, bytes(data[offset + 4:offset + 5]), data_length))
+            offset += 2 + meta_length + 2 + data_length
+
+    def load_var_file(self, file: BinaryIO):
+        start = file.tell()
+        file.seek(53, 1)
+
+        self.records = []
+        offset, end = 55, 55 + int.from_bytes(file.read(2), 'little')
+        while offset < end and len(meta := file.read(5)) == 5:
+            meta_length = int.from_bytes(meta[0:2], 'little')
+            data_length = int.from_bytes(meta[2:4], 'little')
+
+            self.records.append(self.Record(offset, meta_length, meta[4:5], data_length))
+            offset += 2 + meta_length + 2 + data_length
+            file.seek(start + offset)
+
+    def load_bytes(self, data: ByteString):
+        data = buffer(data)
+
+        if data[:4] != self.magic:
+            raise ValueError("data is not a var index")
+
+        self.records = [self.Record(int.from_bytes(data[i:i + 4], 'little'),
+                                    int.from_bytes(data[i + 4:i + 6], 'little'),
+                                    bytes(data[i + 6:i + 7]),
+                                    int.from_bytes(data[i + 7:i + 9], 'little'))
+                        for i in range(8, 8 + 9 * int.from_bytes(data[4:8], 'little'), 9)]
+
+    def bytes(self) -> bytes:
+        return self.magic + int.to_bytes(len(self.records), 4, 'little') + \
+            b''.join(int.to_bytes(record.offset, 4, 'little') + int.to_bytes(record.meta_length, 2, 'little') +
+                     record.type_id + int.to_bytes(record.data_length, 2, 'little') for record in self.records)
+
+    def open(self, filename: str):
+        with open(filename, 'rb') as file:
+            self.load_bytes(file.read())
+
+    def save(self, filename: str):
+        with open(filename, 'wb+') as file:
+            file.write(self.bytes())
+
+
+class EntryMeta(namedtuple("EntryMeta", ["offset", "meta_length", "type_id", "name", "version", "archived",
+                                         "data_length"])):
+    __slots__ = ()
+
+    @property
+    def entry_type(self) -> type[TIEntry]:
+        return TIEntry.type_ids.get(self.type_id, TIEntry)
+
+    def decode_name(self) -> str:
+        return self.entry_type.name.converter.get(self.name, None)
+
+
+def scan_meta(source: str | BinaryIO | ByteString) -> list[EntryMeta]:
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            return scan_meta(file)
+
+    # Data sections are skipped over rather than read
+    read = reader(source)
+
+    entries = []
+    offset, end = 55, 55 + int.from_bytes(read(53, 2), 'little')
+    while offset < end and len(meta := read(offset, 17)) >= 15:
+        meta_length = int.from_bytes(meta[0:2], 'little')
+        data_length = int.from_bytes(meta[2:4], 'little')
+        flash = meta_length > TIEntry.base_meta_length
+
+        entries.append(EntryMeta(offset, meta_length, bytes(meta[4:5]), bytes(meta[5:13]),
+                                 bytes(meta[13:14]) if flash else b'\x00', flash and meta[14] != 0x00,
+                                 data_length))
+        offset += 2 + meta_length + 2 + data_length
+
+    return entries
+
+
+def _entry_parts(header: TIHeader) -> Generator[int | bytes, bytes, None]:
+    # Parses a var stream without doing any I/O, so that sync and async readers can share it
+    # Yields the length of each read it needs, which is sent back, or the bytes of each complete entry
+
+    # Read header
+    header.load_bytes((yield 53))
+    entry_length = int.from_bytes((yield 2), 'little')
+
+    # Read entries one at a time
+    checksum = 0
+    while entry_length > 0:
+        lengths = yield 4
+        meta_length = int.from_bytes(lengths[0:2], 'little')
+        data_length = int.from_bytes(lengths[2:4], 'little')
+
+        data = lengths + (yield meta_length + data_length)
+        if len(data) < 4 + meta_length + data_length:
+            report("entry_truncated", "The var file ended unexpectedly; the last entry could not be read.")
+            return
+
+        checksum += sum(data)
+        entry_length -= len(data)
+
+        yield data
+
+    # Check² sum
+    checksum = int.to_bytes(checksum & 0xFFFF, 2, 'little')
+    if (expected := (yield 2)) != checksum:
+        report("checksum", "The checksum is incorrect (expected {}, got {}).", checksum, expected)
+
+
+def iter_entries(stream: BinaryIO, *, header: TIHeader = None) -> Iterator[TIEntry]:
+    def read(length: int) -> bytes:
+        data = b''
+        while len(data) < length and (chunk := stream.read(length - len(data))):
+            data += chunk
+
+        return data
+
+    parts = _entry_parts(header or TIHeader())
+    part = next(parts, None)
+    while part is not None:
+        if isinstance(part, int):
+            part = _send(parts, read(part))
+
+        else:
+            entry = TIEntry()
+            entry.load_bytes(part)
+            yield entry
+
+            part = next(parts, None)
+
+
+async def aiter_entries(stream, *, header: TIHeader = None) -> AsyncIterator[TIEntry]:
+    # Any stream with a coroutine read method, e.g. asyncio.StreamReader or an aiohttp payload
+    async def read(length: int) -> bytes:
+        data = b''
+        while len(data) < length and (chunk := await stream.read(length - len(data))):
+            data += chunk
+
+        return data
+
+    parts = _entry_parts(header or TIHeader())
+    part = next(parts, None)
+    while part is not None:
+        if isinstance(part, int):
+            part = _send(parts, await read(part))
+
+        else:
+            # Entries are parsed off the event loop
+            entry = TIEntry()
+            async with aio.limited():
+                await aio.run(entry.load_bytes, part)
+
+            yield entry
+
+            part = next(parts, None)
+
+
+def _send(parts: Generator, data: bytes) -> int | bytes | None:
+    try:
+        return parts.send(data)
+
+    except StopIteration:
+        return None
 
 
-__all__ = ["TIHeader", "TIEntry", "TIVar", "SizedEntry"]
+__all__ = ["TIHeader", "TIEntry", "TIVar", "TIVarIndex", "SizedEntry",
+           "EntryMeta", "iter_entries", "aiter_entries", "scan_meta"]